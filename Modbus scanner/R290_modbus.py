@@ -4,19 +4,71 @@ Grant Aerona3 R290 Modbus Register Discovery Tool
 Systematically scans modbus registers to identify active ones
 """
 
-import time
+import asyncio
 import json
+import socket
+import struct
+
+try:
+    import orjson  # much faster serialization for the large scan dumps
+except ImportError:
+    orjson = None
+from array import array
 from datetime import datetime
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import argparse
 
+# Cap on in-flight Modbus requests - the async client multiplexes these on one
+# socket via transaction IDs, so we pipeline reads instead of sleeping between them
+MAX_CONCURRENT_READS = 8
+
+# Modbus allows up to 125 holding/input registers per read request
+MAX_REGISTERS_PER_READ = 125
+
+def _chunk_range(start, end, batch_size):
+    """Yield (addr, count) pairs covering start..end in maximal batches"""
+    for addr in range(start, end + 1, batch_size):
+        yield addr, min(batch_size, end - addr + 1)
+
+# Monitored addresses closer together than this are fetched in one read even
+# if there are unmonitored registers in between - the extra payload is far
+# cheaper than another round-trip
+MONITOR_GAP_THRESHOLD = 10
+
+def _monitor_blocks(addresses, gap=MONITOR_GAP_THRESHOLD):
+    """Group addresses into (start, count, offsets) read blocks
+
+    offsets are the positions of the monitored addresses within the block, so
+    filler registers read across small gaps are fetched but never diffed.
+    """
+    blocks = []
+    for addr in sorted(set(addresses)):
+        if blocks:
+            start, count, offsets = blocks[-1]
+            span = addr - start + 1
+            if addr - (start + count - 1) <= gap and span <= MAX_REGISTERS_PER_READ:
+                blocks[-1][1] = span
+                offsets.append(addr - start)
+                continue
+        blocks.append([addr, 1, [0]])
+    return [(start, count, tuple(offsets)) for start, count, offsets in blocks]
+
 class ModbusRegisterScanner:
-    def __init__(self, host, port=502, unit_id=1):
+    def __init__(self, host, port=502, unit_id=1, verbose=False):
         self.host = host
         self.port = port
         self.unit_id = unit_id
+        self.verbose = verbose
         self.client = None
+        self._read_semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        # Parallel address/value arrays per register type - ~2 bytes per entry
+        # instead of a 4-field dict; the verbose JSON layout is only built in
+        # save_results
+        self._scanned = {
+            'holding_registers': (array('H'), array('H')),
+            'input_registers': (array('H'), array('H')),
+        }
         self.results = {
             'scan_info': {
                 'timestamp': datetime.now().isoformat(),
@@ -29,12 +81,13 @@ class ModbusRegisterScanner:
             'coils': {},
             'discrete_inputs': {}
         }
-    
-    def connect(self):
+
+    async def connect(self):
         """Connect to the modbus device"""
         try:
-            self.client = ModbusTcpClient(self.host, port=self.port)
-            if self.client.connect():
+            self.client = AsyncModbusTcpClient(self.host, port=self.port)
+            if await self.client.connect():
+                self._tune_socket()
                 print(f"✅ Connected to {self.host}:{self.port}")
                 return True
             else:
@@ -43,167 +96,239 @@ class ModbusRegisterScanner:
         except Exception as e:
             print(f"❌ Connection error: {e}")
             return False
-    
-    def scan_holding_registers(self, start=0, end=1000, batch_size=10):
-        """Scan holding registers in batches"""
+
+    def _tune_socket(self):
+        """Disable Nagle and enable keepalive on the underlying TCP socket
+
+        Modbus requests are tiny, so Nagle's algorithm can hold them back
+        waiting to coalesce; keepalive catches a silently dropped link during
+        long monitoring runs. Best effort - transport internals vary between
+        pymodbus versions.
+        """
+        try:
+            sock = self.client.transport.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (AttributeError, OSError):
+            pass
+
+    async def _read_batch(self, read_fn, addr, count):
+        """Issue one bounded batch read through the shared semaphore"""
+        async with self._read_semaphore:
+            return await read_fn(addr, count=count, device_id=self.unit_id)
+
+    async def scan_holding_registers(self, start=0, end=1000, batch_size=None):
+        """Scan holding registers in maximal pipelined batches"""
         print(f"\n🔍 Scanning Holding Registers {start}-{end}")
 
-        for addr in range(start, end + 1, batch_size):
-            try:
-                # Read batch of registers
-                count = min(batch_size, end - addr + 1)
-                result = self.client.read_holding_registers(addr, count=count, device_id=self.unit_id)
-
-                if not result.isError():
-                    for i, value in enumerate(result.registers):
-                        reg_addr = addr + i
-                        if value != 0:  # Only store non-zero values
-                            self.results['holding_registers'][reg_addr] = {
-                                'value': value,
-                                'hex': f"0x{value:04X}",
-                                'signed': value if value < 32768 else value - 65536,
-                                'float_interpretation': self._try_float_conversion(value)
-                            }
-                            print(f"  📍 HR{reg_addr}: {value} (0x{value:04X})")
-
-                time.sleep(0.1)  # Be nice to the device
-
-            except Exception as e:
-                print(f"  ⚠️  Error reading HR{addr}: {e}")
-
-    def scan_input_registers(self, start=0, end=1000, batch_size=10):
-        """Scan input registers in batches"""
+        if batch_size is None:
+            batch_size = min(MAX_REGISTERS_PER_READ, end - start + 1)
+        chunks = list(_chunk_range(start, end, batch_size))
+        tasks = [
+            self._read_batch(self.client.read_holding_registers, addr, count)
+            for addr, count in chunks
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (addr, _count), result in zip(chunks, results):
+            if isinstance(result, Exception):
+                print(f"  ⚠️  Error reading HR{addr}: {result}")
+                continue
+            if not result.isError():
+                self._decode_batch('holding_registers', 'HR', addr, result.registers)
+
+    async def scan_input_registers(self, start=0, end=1000, batch_size=None):
+        """Scan input registers in maximal pipelined batches"""
         print(f"\n🔍 Scanning Input Registers {start}-{end}")
 
-        for addr in range(start, end + 1, batch_size):
-            try:
-                count = min(batch_size, end - addr + 1)
-                result = self.client.read_input_registers(addr, count=count, device_id=self.unit_id)
-
-                if not result.isError():
-                    for i, value in enumerate(result.registers):
-                        reg_addr = addr + i
-                        if value != 0:
-                            self.results['input_registers'][reg_addr] = {
-                                'value': value,
-                                'hex': f"0x{value:04X}",
-                                'signed': value if value < 32768 else value - 65536,
-                                'float_interpretation': self._try_float_conversion(value)
-                            }
-                            print(f"  📍 IR{reg_addr}: {value} (0x{value:04X})")
-
-                time.sleep(0.1)
-
-            except Exception as e:
-                print(f"  ⚠️  Error reading IR{addr}: {e}")
-
-    def scan_coils(self, start=0, end=100):
+        if batch_size is None:
+            batch_size = min(MAX_REGISTERS_PER_READ, end - start + 1)
+        chunks = list(_chunk_range(start, end, batch_size))
+        tasks = [
+            self._read_batch(self.client.read_input_registers, addr, count)
+            for addr, count in chunks
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (addr, _count), result in zip(chunks, results):
+            if isinstance(result, Exception):
+                print(f"  ⚠️  Error reading IR{addr}: {result}")
+                continue
+            if not result.isError():
+                self._decode_batch('input_registers', 'IR', addr, result.registers)
+
+    async def scan_coils(self, start=0, end=100):
         """Scan coils (discrete outputs)"""
         print(f"\n🔍 Scanning Coils {start}-{end}")
 
         try:
             count = end - start + 1
-            result = self.client.read_coils(start, count=count, device_id=self.unit_id)
+            result = await self.client.read_coils(start, count=count, device_id=self.unit_id)
 
             if not result.isError():
                 for i, value in enumerate(result.bits):
                     if value:  # Only store active coils
                         coil_addr = start + i
                         self.results['coils'][coil_addr] = True
-                        print(f"  📍 Coil{coil_addr}: {value}")
+                        if self.verbose:
+                            print(f"  📍 Coil{coil_addr}: {value}")
         except Exception as e:
             print(f"  ⚠️  Error reading coils: {e}")
 
-    def scan_discrete_inputs(self, start=0, end=100):
+    async def scan_discrete_inputs(self, start=0, end=100):
         """Scan discrete inputs"""
         print(f"\n🔍 Scanning Discrete Inputs {start}-{end}")
 
         try:
             count = end - start + 1
-            result = self.client.read_discrete_inputs(start, count=count, device_id=self.unit_id)
+            result = await self.client.read_discrete_inputs(start, count=count, device_id=self.unit_id)
 
             if not result.isError():
                 for i, value in enumerate(result.bits):
                     if value:  # Only store active inputs
                         input_addr = start + i
                         self.results['discrete_inputs'][input_addr] = True
-                        print(f"  📍 DI{input_addr}: {value}")
+                        if self.verbose:
+                            print(f"  📍 DI{input_addr}: {value}")
         except Exception as e:
             print(f"  ⚠️  Error reading discrete inputs: {e}")
 
-        try:
-            count = end - start + 1
-            result = self.client.read_discrete_inputs(start, count=count, device_id=self.unit_id)
-            if not result.isError():
-                for i, value in enumerate(result.bits[:end-start+1]):
-                    if value:
-                        addr = start + i
-                        self.results['discrete_inputs'][addr] = value
-                        print(f"  📍 DI{addr}: {value}")
-        except Exception as e:
-            print(f"  ⚠️  Error reading discrete inputs: {e}")
-    
+    def _decode_batch(self, result_key, label, addr, registers):
+        """Decode one batch response, storing only non-zero address/value pairs"""
+        # Filter first in one tight comprehension so the work below runs only
+        # for the (typically sparse) active registers
+        non_zero = [(addr + i, value) for i, value in enumerate(registers) if value]
+        if not non_zero:
+            return
+
+        # Bind the bound methods once - the per-register loop then runs on
+        # locals only, with no attribute lookups or helper dispatch inside it
+        addrs, values = self._scanned[result_key]
+        append_addr = addrs.append
+        append_value = values.append
+        if self.verbose:
+            for reg_addr, value in non_zero:
+                append_addr(reg_addr)
+                append_value(value)
+                print(f"  📍 {label}{reg_addr}: {value} (0x{value:04X})")
+        else:
+            for reg_addr, value in non_zero:
+                append_addr(reg_addr)
+                append_value(value)
+            print(f"  📍 {label}{non_zero[0][0]}-{non_zero[-1][0]}: {len(non_zero)} active")
+
+    def _materialize_results(self):
+        """Expand the compact scan arrays into the verbose JSON result layout"""
+        for result_key, (addrs, values) in self._scanned.items():
+            if not values:
+                continue
+            # Hex-format the whole value array in one C-level pass and slice
+            # 4 chars per register instead of one f-string per value
+            packed_hex = struct.pack(f'>{len(values)}H', *values).hex().upper()
+            store = self.results[result_key]
+            for idx, (reg_addr, value) in enumerate(zip(addrs, values)):
+                store[reg_addr] = {
+                    'value': value,
+                    'hex': "0x" + packed_hex[idx * 4:idx * 4 + 4],
+                    # Branchless int16 reinterpretation: subtract 0x10000 only
+                    # when the sign bit is set
+                    'signed': value - ((value & 0x8000) << 1),
+                    'float_interpretation': self._try_float_conversion(value)
+                }
+
     def _try_float_conversion(self, value):
-        """Try to interpret value as temperature/pressure etc"""
-        interpretations = {}
-        
-        # Common HVAC interpretations
-        interpretations['temp_c_div10'] = value / 10.0
-        interpretations['temp_c_div100'] = value / 100.0
-        interpretations['pressure_bar_div10'] = value / 10.0
-        interpretations['percentage'] = value / 100.0 if value <= 10000 else None
-        
-        return interpretations
-    
-    def monitor_changes(self, registers_to_monitor, duration=60):
+        """Try to interpret value as temperature/pressure etc
+
+        temp_c_div10 doubles as the bar-pressure interpretation (same /10
+        scaling), so the former pressure_bar_div10 duplicate is gone.
+        """
+        # Common HVAC interpretations; multiply by the reciprocal instead of
+        # dividing - cheaper on CPython and this runs per stored register
+        return {
+            'temp_c_div10': value * 0.1,
+            'temp_c_div100': value * 0.01,
+            'percentage': value * 0.01 if value <= 10000 else None,
+        }
+
+    async def monitor_changes(self, registers_to_monitor, duration=60):
         """Monitor specific registers for changes over time"""
         print(f"\n👀 Monitoring registers for {duration} seconds...")
 
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         previous_values = {}
+        previous_blocks = {}
+
+        # One read per block of nearby addresses instead of one read per address;
+        # small gaps between monitored registers ride along in the same request
+        block_plan = {
+            reg_type: _monitor_blocks(addresses)
+            for reg_type, addresses in registers_to_monitor.items()
+        }
 
-        while time.time() - start_time < duration:
-            for reg_type, addresses in registers_to_monitor.items():
-                for addr in addresses:
+        while loop.time() - start_time < duration:
+            for reg_type, blocks in block_plan.items():
+                for block_start, block_count, offsets in blocks:
                     try:
                         if reg_type == 'holding':
-                            result = self.client.read_holding_registers(addr, count=1, device_id=self.unit_id)
+                            result = await self.client.read_holding_registers(block_start, count=block_count, device_id=self.unit_id)
                         elif reg_type == 'input':
-                            result = self.client.read_input_registers(addr, count=1, device_id=self.unit_id)
+                            result = await self.client.read_input_registers(block_start, count=block_count, device_id=self.unit_id)
 
                         if not result.isError():
-                            current_value = result.registers[0]
-                            key = f"{reg_type}_{addr}"
+                            registers = result.registers
+                            # Report-by-exception: if the whole block matches
+                            # the previous read, skip per-address diffing -
+                            # the common idle-device case costs one comparison
+                            block_key = (reg_type, block_start)
+                            if previous_blocks.get(block_key) == registers:
+                                continue
+                            previous_blocks[block_key] = registers
+                            for offset in offsets:
+                                addr = block_start + offset
+                                current_value = registers[offset]
+                                key = f"{reg_type}_{addr}"
 
-                            if key in previous_values and previous_values[key] != current_value:
-                                print(f"  🔄 {reg_type.upper()}{addr}: {previous_values[key]} → {current_value}")
+                                if key in previous_values and previous_values[key] != current_value:
+                                    print(f"  🔄 {reg_type.upper()}{addr}: {previous_values[key]} → {current_value}")
 
-                            previous_values[key] = current_value
+                                previous_values[key] = current_value
 
                     except Exception as e:
-                        print(f"  ⚠️  Error monitoring {reg_type}{addr}: {e}")
+                        print(f"  ⚠️  Error monitoring {reg_type}{block_start}-{block_start + block_count - 1}: {e}")
+
+            await asyncio.sleep(2)
 
-            time.sleep(2)
-    
     def save_results(self, filename=None):
         """Save scan results to JSON file"""
+        self._materialize_results()
+
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"r290_modbus_scan_{timestamp}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        
+
+        if orjson is not None:
+            # OPT_NON_STR_KEYS: the register tables are keyed by int address
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
+
         print(f"\n💾 Results saved to {filename}")
         return filename
-    
+
     def disconnect(self):
         """Disconnect from modbus device"""
         if self.client:
             self.client.close()
             print("🔌 Disconnected")
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description='Grant Aerona3 R290 Modbus Register Scanner')
     parser.add_argument('host', help='IP address of the heat pump')
     parser.add_argument('--port', type=int, default=502, help='Modbus TCP port (default: 502)')
@@ -213,28 +338,29 @@ def main():
     parser.add_argument('--ir-start', type=int, default=0, help='Input registers start address')
     parser.add_argument('--ir-end', type=int, default=1000, help='Input registers end address')
     parser.add_argument('--monitor', action='store_true', help='Monitor for register changes')
-    
+    parser.add_argument('--verbose', action='store_true', help='Print every active register as it is found')
+
     args = parser.parse_args()
-    
-    scanner = ModbusRegisterScanner(args.host, args.port, args.unit)
-    
-    if not scanner.connect():
+
+    scanner = ModbusRegisterScanner(args.host, args.port, args.unit, verbose=args.verbose)
+
+    if not await scanner.connect():
         return
-    
+
     try:
-        # Scan holding registers
-        scanner.scan_holding_registers(args.hr_start, args.hr_end)
-        
-        # Scan input registers  
-        scanner.scan_input_registers(args.ir_start, args.ir_end)
-        
-        # Scan coils and discrete inputs
-        scanner.scan_coils()
-        scanner.scan_discrete_inputs()
-        
+        # The four scans are independent and the async client demultiplexes
+        # concurrent requests by transaction ID, so overlap them - total
+        # wall-clock becomes roughly the slowest scan instead of the sum
+        await asyncio.gather(
+            scanner.scan_holding_registers(args.hr_start, args.hr_end),
+            scanner.scan_input_registers(args.ir_start, args.ir_end),
+            scanner.scan_coils(),
+            scanner.scan_discrete_inputs(),
+        )
+
         # Save initial scan
         filename = scanner.save_results()
-        
+
         # Optional monitoring phase
         if args.monitor:
             # Monitor registers that had non-zero values
@@ -242,19 +368,19 @@ def main():
                 'holding': list(scanner.results['holding_registers'].keys()),
                 'input': list(scanner.results['input_registers'].keys())
             }
-            
+
             if registers_to_monitor['holding'] or registers_to_monitor['input']:
-                scanner.monitor_changes(registers_to_monitor, duration=120)
+                await scanner.monitor_changes(registers_to_monitor, duration=120)
                 scanner.save_results(filename.replace('.json', '_with_monitoring.json'))
-        
+
         print(f"\n✅ Scan complete! Found:")
         print(f"   • {len(scanner.results['holding_registers'])} active holding registers")
         print(f"   • {len(scanner.results['input_registers'])} active input registers")
         print(f"   • {len(scanner.results['coils'])} active coils")
         print(f"   • {len(scanner.results['discrete_inputs'])} active discrete inputs")
-        
+
     finally:
         scanner.disconnect()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
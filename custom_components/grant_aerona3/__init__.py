@@ -27,41 +27,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Grant Aerona3 from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Claim any connection the config flow parked after validation, so the
+    # first refresh below reuses the probe socket instead of reconnecting
+    # seconds after it was validated.
+    pending_client = None
+    pending = hass.data[DOMAIN].get("pending_clients")
+    if pending:
+        key = (entry.data.get("host"), entry.data.get("port"), entry.data.get("unit_id"))
+        pending_client = pending.pop(key, None)
+
+    coordinator = None
     try:
         # Initialize coordinator
         coordinator = GrantAerona3Coordinator(hass, entry)
-        
+        if pending_client is not None:
+            coordinator.adopt_client(pending_client)
+
+
         # Perform initial data refresh
         await coordinator.async_config_entry_first_refresh()
         
         # Store coordinator in hass data
         hass.data[DOMAIN][entry.entry_id] = coordinator
         
-        # Set up all platforms
+        # Set up all platforms - async_forward_entry_setups already runs the
+        # per-platform setups concurrently; the first refresh above must stay
+        # ahead of it because entities read coordinator.data on construction.
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        
+
         # Set up options update listener
         entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-        
-        host = entry.data.get("host")
-        unit_id = entry.data.get("unit_id", entry.data.get("slave_id"))  # fallback for old configs
 
-        _LOGGER.info(
-            "Grant Aerona3 ASHP integration setup completed for %s (v1.1.1 with ashp_ prefixes)",
-            host
-        )
-        
-        # Log entity count for debugging
-        entity_count = (
-            len(coordinator.data.get("input_registers", {}) or {}) +
-            len(coordinator.data.get("holding_registers", {}) or {}) +
-            7
-        )
-        _LOGGER.info("Created %d ASHP entities with ashp_ prefixes (unit_id: %s)", entity_count, unit_id)
-        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            host = entry.data.get("host")
+            unit_id = entry.data.get("unit_id", entry.data.get("slave_id"))  # fallback for old configs
+
+            _LOGGER.info(
+                "Grant Aerona3 ASHP integration setup completed for %s (v1.1.1 with ashp_ prefixes)",
+                host
+            )
+
+            # Log entity count for debugging
+            entity_count = (
+                len(coordinator.data.get("input_registers", {}) or {}) +
+                len(coordinator.data.get("holding_registers", {}) or {}) +
+                7
+            )
+            _LOGGER.info("Created %d ASHP entities with ashp_ prefixes (unit_id: %s)", entity_count, unit_id)
+
         return True
         
     except Exception as err:
+        if coordinator is not None:
+            # Release the shared-client refcount taken in __init__ so a
+            # failed first refresh can't pin the holder across retries
+            await coordinator.async_shutdown()
         _LOGGER.error("Failed to setup Grant Aerona3 ASHP integration: %s", err)
         raise ConfigEntryNotReady(f"Failed to setup integration: {err}") from err
 
@@ -72,8 +92,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Remove coordinator from hass data
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        # Remove coordinator from hass data and close its Modbus connection
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
         _LOGGER.info("Grant Aerona3 ASHP integration unloaded successfully")
 
     return unload_ok
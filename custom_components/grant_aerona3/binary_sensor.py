@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-import asyncio
+import time
 from typing import Any, Dict, Optional
 
 from homeassistant.components.binary_sensor import (
@@ -13,17 +13,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL, INPUT_REGISTER_MAP
+from .const import DOMAIN, MANUFACTURER, MODEL
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-def get_scaled_input(coordinator: GrantAerona3Coordinator, reg_id: int) -> Optional[float]:
-    """Get scaled input register value."""
-    reg_info = INPUT_REGISTER_MAP.get(reg_id, {})
-    scale = reg_info.get("scale", 1)
-    value = coordinator.data.get("input_registers", {}).get(reg_id)
-    return value * scale if value is not None else None
+# Alarm code descriptions - module-level so lookups don't rebuild the dict
+_ALARM_CODES = {
+    0: "No Alarm",
+    1: "High Pressure",
+    2: "Low Pressure",
+    3: "Compressor Overload",
+    4: "Fan Motor Error",
+    5: "Water Flow Error",
+    6: "Temperature Sensor Error",
+    7: "Communication Error",
+}
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,17 +59,15 @@ class GrantAerona3BaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        # Built once per entity - HA reads device_info repeatedly during
+        # setup and registry updates, so don't rebuild the dict per access
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
             "name": "ASHP Grant Aerona3",
             "manufacturer": MANUFACTURER,
             "model": MODEL,
             "sw_version": "1.1.1",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
+            "configuration_url": f"http://{config_entry.data.get('host', '')}",
         }
 
     @property
@@ -72,6 +75,15 @@ class GrantAerona3BaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
+    def _scaled_inputs(self) -> Optional[Dict[int, float]]:
+        """Return the per-refresh scaled input values, or None without data.
+
+        Bound once per property call so multi-register checks do a single
+        coordinator.data dereference instead of one per register.
+        """
+        data = self.coordinator.data
+        return data["scaled_inputs"] if data else None
+
 class GrantAerona3CompressorSensor(GrantAerona3BaseBinarySensor):
     """Binary sensor for compressor running status."""
     
@@ -87,18 +99,18 @@ class GrantAerona3CompressorSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if compressor is running."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        frequency = get_scaled_input(self.coordinator, 1)
-        power = get_scaled_input(self.coordinator, 3)
-        return (frequency or 0) > 0 or (power or 0) > 200
+        return (scaled.get(1) or 0) > 0 or (scaled.get(3) or 0) > 200
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
+        scaled = self._scaled_inputs() or {}
         return {
-            "compressor_frequency": get_scaled_input(self.coordinator, 1),
-            "power_consumption": get_scaled_input(self.coordinator, 3),
+            "compressor_frequency": scaled.get(1),
+            "power_consumption": scaled.get(3),
         }
 
 class GrantAerona3DefrostSensor(GrantAerona3BaseBinarySensor):
@@ -116,18 +128,19 @@ class GrantAerona3DefrostSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if defrost is active."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        outdoor_temp = get_scaled_input(self.coordinator, 6)  # FIX: reg 6 = Outdoor Air Temp
-        frequency = get_scaled_input(self.coordinator, 1)
-        return (outdoor_temp is not None and outdoor_temp <= 5) and (frequency == 0)
+        outdoor_temp = scaled.get(6)  # FIX: reg 6 = Outdoor Air Temp
+        return (outdoor_temp is not None and outdoor_temp <= 5) and (scaled.get(1) == 0)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
+        scaled = self._scaled_inputs() or {}
         return {
-            "outdoor_temperature": get_scaled_input(self.coordinator, 6),  # FIX: reg 6
-            "compressor_frequency": get_scaled_input(self.coordinator, 1),
+            "outdoor_temperature": scaled.get(6),  # FIX: reg 6
+            "compressor_frequency": scaled.get(1),
         }
 
 class GrantAerona3AlarmSensor(GrantAerona3BaseBinarySensor):
@@ -167,17 +180,7 @@ class GrantAerona3AlarmSensor(GrantAerona3BaseBinarySensor):
         """Get alarm description from code."""
         if code is None:
             return "No Data"
-        alarm_codes = {
-            0: "No Alarm",
-            1: "High Pressure",
-            2: "Low Pressure",
-            3: "Compressor Overload",
-            4: "Fan Motor Error",
-            5: "Water Flow Error",
-            6: "Temperature Sensor Error",
-            7: "Communication Error",
-        }
-        return alarm_codes.get(code, f"Unknown Alarm ({code})")
+        return _ALARM_CODES.get(code, f"Unknown Alarm ({code})")
 
 class GrantAerona3HeatingActiveSensor(GrantAerona3BaseBinarySensor):
     """Binary sensor for heating active status."""
@@ -194,11 +197,12 @@ class GrantAerona3HeatingActiveSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if heating is active."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        operation_mode = get_scaled_input(self.coordinator, 10)  # FIX: reg 10 = Selected Operating Mode
-        flow_temp = get_scaled_input(self.coordinator, 9)         # FIX: reg 9 = Outgoing Water Temp
-        return_temp = get_scaled_input(self.coordinator, 0)
+        operation_mode = scaled.get(10)  # FIX: reg 10 = Selected Operating Mode
+        flow_temp = scaled.get(9)        # FIX: reg 9 = Outgoing Water Temp
+        return_temp = scaled.get(0)
         return operation_mode == 1 and (flow_temp or 0) > (return_temp or 0) + 1
 
 class GrantAerona3DHWActiveSensor(GrantAerona3BaseBinarySensor):
@@ -216,10 +220,10 @@ class GrantAerona3DHWActiveSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if DHW is active."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        dhw_mode = get_scaled_input(self.coordinator, 13)
-        return (dhw_mode or 0) > 0
+        return (scaled.get(13) or 0) > 0
 
 class GrantAerona3BackupHeaterSensor(GrantAerona3BaseBinarySensor):
     """Binary sensor for backup heater active status."""
@@ -236,10 +240,11 @@ class GrantAerona3BackupHeaterSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if backup heater is active."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        outdoor_temp = get_scaled_input(self.coordinator, 6)  # FIX: reg 6 = Outdoor Air Temp
-        power = get_scaled_input(self.coordinator, 3)          # FIX: reg 3 = Current Consumption (scaled *100 = W)
+        outdoor_temp = scaled.get(6)  # FIX: reg 6 = Outdoor Air Temp
+        power = scaled.get(3)         # FIX: reg 3 = Current Consumption (scaled *100 = W)
         return (outdoor_temp is not None and outdoor_temp < -5) and ((power or 0) * 100) > 5000
 
 class GrantAerona3FrostProtectionSensor(GrantAerona3BaseBinarySensor):
@@ -257,10 +262,11 @@ class GrantAerona3FrostProtectionSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if frost protection is active."""
-        if not self.coordinator.data:
+        scaled = self._scaled_inputs()
+        if scaled is None:
             return False
-        outdoor_temp = get_scaled_input(self.coordinator, 6)  # FIX: reg 6 = Outdoor Air Temp
-        flow_temp = get_scaled_input(self.coordinator, 9)      # FIX: reg 9 = Outgoing Water Temp
+        outdoor_temp = scaled.get(6)  # FIX: reg 6 = Outdoor Air Temp
+        flow_temp = scaled.get(9)     # FIX: reg 9 = Outgoing Water Temp
         return (outdoor_temp is not None and outdoor_temp < 0) or (flow_temp is not None and flow_temp < 5)
 
 class GrantAerona3WeatherCompActiveSensorZone1(GrantAerona3BaseBinarySensor):
@@ -315,23 +321,31 @@ class GrantAerona3CommunicationSensor(GrantAerona3BaseBinarySensor):
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
         self._attr_icon = "mdi:connection"
 
+    def _seconds_since_update(self) -> Optional[float]:
+        """Age of the last refresh, with a single time lookup per call.
+
+        NOTE: the time must be read here, not cached on the coordinator - a
+        refresh-time snapshot would make the staleness check compare the
+        update against itself and the sensor would never report a loss.
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        return time.monotonic() - data.get("last_update", 0)
+
     @property
     def is_on(self) -> bool:
         """Return true if communication is active."""
-        if not self.coordinator.data:
-            return False
-        last_update = self.coordinator.data.get("last_update", 0)
-        current_time = asyncio.get_running_loop().time()
-        return (current_time - last_update) < 120
+        age = self._seconds_since_update()
+        return age is not None and age < 120
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
+        age = self._seconds_since_update()
+        if age is None:
             return {}
-        last_update = self.coordinator.data.get("last_update", 0)
-        current_time = asyncio.get_running_loop().time()
         return {
-            "last_update_seconds_ago": round(current_time - last_update),
+            "last_update_seconds_ago": round(age),
             "coordinator_available": self.coordinator.last_update_success,
         }
@@ -22,28 +22,90 @@ from .const import (
     MODEL,
     OPERATING_MODES,
     CLIMATE_MODES,
-    HOLDING_REGISTER_MAP,
-    INPUT_REGISTER_MAP,
+    HOLDING_MIN_MAX_STEP,
+    HOLDING_SCALES,
+    HOLDING_INV_SCALES,
+    INPUT_SCALES,
+    INPUT_INV_SCALES,
 )
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mode dispatch tables - hoisted so state reads and service calls index a
+# constant instead of rebuilding dict literals or walking if/elif chains
+_MODE_TO_STR = {1: "heating", 2: "cooling"}
+_DHW_MODES = {0: "Off", 1: "Comfort", 2: "Economy", 3: "Boost"}
+# DHW mode -> setpoint holding register (Comfort/Economy/Boost)
+_DHW_TARGET_REG = {1: 28, 2: 29, 3: 31}
+# Pre-bound .get references save an attribute resolution per attribute read
+_DHW_MODES_GET = _DHW_MODES.get
+# OPERATING_MODES is a tuple indexed by the raw mode code; bound len for
+# the range guard on values read off the wire
+_N_OP_MODES = len(OPERATING_MODES)
+_REG_MODE_TO_HVAC = {1: HVACMode.HEAT, 2: HVACMode.COOL}
+_HVAC_TO_REG_VALUE = {
+    HVACMode.HEAT: 1,
+    HVACMode.COOL: 2,
+    HVACMode.OFF: 0,
+    HVACMode.AUTO: 4,
+}
+
+def _build_hvac_mode_lut() -> dict:
+    """Expand the hvac_mode decision into a (mode, power_ok, freq_on) table.
+
+    One hash probe at read time replaces the branch chain; unknown modes
+    fall back to OFF via .get at the lookup site.
+    """
+    lut = {}
+    for mode in range(5):
+        for power_ok in (False, True):
+            for freq_on in (False, True):
+                if mode == 0 or (not power_ok and not freq_on):
+                    value = HVACMode.OFF
+                else:
+                    value = _REG_MODE_TO_HVAC.get(mode, HVACMode.OFF)
+                lut[(mode, power_ok, freq_on)] = value
+    return lut
+
+_HVAC_MODE_LUT = _build_hvac_mode_lut()
+
+# Integer reciprocals of the scales now live in const alongside the scale
+# tables themselves; local aliases keep the hot-path names short
+_INV_SCALE_HOLDING = HOLDING_INV_SCALES
+_INV_SCALE_INPUT = INPUT_INV_SCALES
+
+def _compile_attr_plan(*specs: tuple[str, str, int]) -> tuple:
+    """Compile (name, "i"/"h", reg_id) specs into (name, regs_index, reg_id, scale).
+
+    The scale is baked in at import time, so extra_state_attributes can run
+    as one tight loop over the plan instead of a helper call per attribute.
+    """
+    scales = {"i": INPUT_SCALES, "h": HOLDING_SCALES}
+    index = {"i": 0, "h": 1}
+    return tuple(
+        (name, index[kind], reg_id, scales[kind].get(reg_id, 1))
+        for name, kind, reg_id in specs
+    )
+
 def get_scaled_register(
-    registers: dict[int, Any], reg_map: dict[int, dict], reg_id: int
+    registers: dict[int, Any], scales: dict[int, float], reg_id: int
 ) -> Optional[float]:
-    reg_info = reg_map.get(reg_id, {})
-    scale = reg_info.get("scale", 1)
     value = registers.get(reg_id)
-    return value * scale if value is not None else None
+    return value * scales.get(reg_id, 1) if value is not None else None
+
+def _get_scaled_or_zero(
+    registers: dict[int, Any], scales: dict[int, float], reg_id: int
+) -> float:
+    """Scaled read with 0 for missing registers.
+
+    For callers that already treat None and 0 the same this removes the
+    per-read None branch and the (value or 0) re-checks downstream.
+    """
+    return registers.get(reg_id, 0) * scales[reg_id]
 
 def get_reg_min_max_step(reg_id: int) -> tuple[float, float, float]:
-    reg_info = HOLDING_REGISTER_MAP.get(reg_id, {})
-    return (
-        reg_info.get("min", 0),
-        reg_info.get("max", 100),
-        reg_info.get("step", 1),
-    )
+    return HOLDING_MIN_MAX_STEP.get(reg_id, (0, 100, 1))
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,6 +122,17 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 class GrantAerona3BaseClimate(CoordinatorEntity, ClimateEntity):
+    # HA's Entity base still carries __dict__, so this doesn't shrink the
+    # instances - but it turns reads of the per-update cache attributes into
+    # slot descriptor lookups, which is what the hot properties touch first
+    __slots__ = (
+        "_config_entry",
+        "_cached_data",
+        "_cached_regs",
+        "_cached_state_data",
+        "_cached_state",
+    )
+
     def __init__(
         self,
         coordinator: GrantAerona3Coordinator,
@@ -69,29 +142,92 @@ class GrantAerona3BaseClimate(CoordinatorEntity, ClimateEntity):
         self._config_entry = config_entry
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_precision = 0.5
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        self._cached_data: Optional[Dict[str, Any]] = None
+        self._cached_regs: tuple[dict, dict] = ({}, {})
+        self._cached_state_data: Optional[Dict[str, Any]] = None
+        self._cached_state: tuple = (0, None, None)
+        # Built once per entity - HA reads device_info repeatedly during
+        # setup and registry updates, so don't rebuild the dict per access
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
             "name": "ASHP Grant Aerona3",
             "manufacturer": MANUFACTURER,
             "model": MODEL,
             "sw_version": "1.1.1",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
+            "configuration_url": f"http://{config_entry.data.get('host', '')}",
         }
 
+    def _regs(self) -> Optional[tuple[dict, dict]]:
+        """Return (input_regs, holding_regs) for the current snapshot.
+
+        The tuple is cached per coordinator.data object (identity check), so
+        the many properties HA reads per state update each cost one dict
+        access instead of re-walking coordinator.data every time.
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        if data is not self._cached_data:
+            # The coordinator publishes these attributes before swapping in
+            # the new data object, so keying on data identity keeps the pair
+            # consistent with the snapshot
+            coordinator = self.coordinator
+            self._cached_regs = (coordinator.input_registers, coordinator.holding_registers)
+            self._cached_data = data
+        return self._cached_regs
+
+    def _handle_coordinator_update(self) -> None:
+        """Drop the per-snapshot caches once per refresh, before HA re-reads us.
+
+        The identity checks in _regs/_decode_state stay as a backstop for
+        reads that land before this listener fires (e.g. during setup).
+        """
+        self._cached_data = None
+        self._cached_state_data = None
+        super()._handle_coordinator_update()
+
+    def _decode_state(self) -> Optional[tuple]:
+        """Return (mode, power, frequency), decoded once per snapshot.
+
+        hvac_mode and hvac_action need the same three registers and HA reads
+        both on every state update; the memoized tuple halves those lookups.
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        if data is not self._cached_state_data:
+            input_regs = data["input_registers"]
+            self._cached_state = (
+                input_regs.get(10, 0),
+                _get_scaled_or_zero(input_regs, INPUT_SCALES, 3),
+                _get_scaled_or_zero(input_regs, INPUT_SCALES, 1),
+            )
+            self._cached_state_data = data
+        return self._cached_state
+
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success
 
-class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
-    """Climate entity for main heating zone (Zone 1)."""
+class GrantAerona3ZoneClimate(GrantAerona3BaseClimate):
+    """Parameterized climate entity for a heating/cooling zone.
+
+    Zone subclasses only set the register constants below; the shared logic
+    lives here once instead of being duplicated per zone.
+    """
+
+    __slots__ = ()
+
+    _zone_name: str
+    _zone_slug: str
+    _room_temp_reg: int
+    _SETPOINT_REGS: dict[str, int]
+    _ATTR_PLAN: tuple
 
     def __init__(self, coordinator, config_entry):
         super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Zone 1"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_zone_1"
+        self._attr_name = f"ASHP {self._zone_name}"
+        self._attr_unique_id = f"ashp_{config_entry.entry_id}_{self._zone_slug}"
         self._attr_supported_features = (
             ClimateEntityFeature.TARGET_TEMPERATURE
             | ClimateEntityFeature.TURN_ON
@@ -103,78 +239,62 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
             HVACMode.COOL,
             HVACMode.AUTO,
         ]
-        min_temp, max_temp, step = get_reg_min_max_step(2)
+        min_temp, max_temp, step = get_reg_min_max_step(self._SETPOINT_REGS["heating"])
         self._attr_min_temp = min_temp
         self._attr_max_temp = max_temp
         self._attr_target_temperature_step = step
 
     @property
     def current_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return None
-        input_regs = self.coordinator.data.get("input_registers", {})
-        room_temp = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 11)
+        input_regs = regs[0]
+        # Dividing the raw register by the integer inverse scale is exact
+        # (e.g. 214 / 10 == 21.4), so no round() is needed to clean up the
+        # FP noise a 0.1 multiply would introduce
+        room_temp = input_regs.get(self._room_temp_reg)
         if room_temp is not None and room_temp > 0:
-            return round(room_temp, 1)
-        return_temp = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 0)
+            return room_temp / _INV_SCALE_INPUT[self._room_temp_reg]
+        return_temp = input_regs.get(0)
         if return_temp is not None and return_temp > 0:
-            return round(return_temp, 1)
+            return return_temp / _INV_SCALE_INPUT[0]
         return 21.0
 
     @property
     def target_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return None
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        current_mode = self._get_current_mode()
-        if current_mode == "heating":
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 2)
-        elif current_mode == "cooling":
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 12)
-        else:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 2)
+        register_id = self._SETPOINT_REGS[self._get_current_mode()]
+        target = regs[1].get(register_id)
         if target is not None and target > 0:
-            return round(target, 1)
+            return target / _INV_SCALE_HOLDING[register_id]
         return self._attr_min_temp
 
     def _get_current_mode(self) -> str:
-        if not self.coordinator.data:
-            return "heating"
-        input_regs = self.coordinator.data.get("input_registers", {})
-        mode = input_regs.get(10, 1)
-        if mode == 1:
-            return "heating"
-        elif mode == 2:
-            return "cooling"
-        else:
+        regs = self._regs()
+        if regs is None:
             return "heating"
+        return _MODE_TO_STR.get(regs[0].get(10, 1), "heating")
 
     @property
     def hvac_mode(self) -> HVACMode:
-        if not self.coordinator.data:
-            return HVACMode.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        mode = input_regs.get(10, 0)
-        power = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3)
-        frequency = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 1)
-        if mode == 0 or ((power or 0) < 100 and (frequency or 0) == 0):
-            return HVACMode.OFF
-        elif mode == 1:
-            return HVACMode.HEAT
-        elif mode == 2:
-            return HVACMode.COOL
-        else:
+        state = self._decode_state()
+        if state is None:
             return HVACMode.OFF
+        mode, power, frequency = state
+        return _HVAC_MODE_LUT.get(
+            (mode, power >= 100, frequency > 0), HVACMode.OFF
+        )
 
     @property
     def hvac_action(self) -> HVACAction:
-        if not self.coordinator.data:
+        state = self._decode_state()
+        if state is None:
             return HVACAction.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        frequency = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 1)
-        power = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3)
-        mode = input_regs.get(10, 1)
-        if (frequency or 0) > 0 or (power or 0) > 200:
+        mode, power, frequency = state
+        if frequency > 0 or power > 200:
             if mode == 2:
                 return HVACAction.COOLING
             else:
@@ -186,222 +306,104 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        scale = HOLDING_REGISTER_MAP[2].get("scale", 1)
-        register_value = int(temperature / scale)
-        current_mode = self._get_current_mode()
-        register_id = 2 if current_mode == "heating" else 12
+        register_id = self._SETPOINT_REGS[self._get_current_mode()]
+        register_value = int(temperature * _INV_SCALE_HOLDING[register_id])
         success = await self.coordinator.async_write_register(register_id, register_value)
         if success:
-            _LOGGER.info("Set Zone 1 target temperature to %s°C (register %d)", temperature, register_id)
+            _LOGGER.info("Set %s target temperature to %s°C (register %d)", self._zone_name, temperature, register_id)
         else:
-            _LOGGER.error("Failed to set Zone 1 target temperature to %s°C", temperature)
+            _LOGGER.error("Failed to set %s target temperature to %s°C", self._zone_name, temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """Set HVAC mode for Zone 1.
+        """Set HVAC mode for the zone.
 
         FIX: This method was missing — HVAC mode buttons had no effect.
         NOTE: Register for writing operating mode must be confirmed from Modbus docs.
         Input register 10 is read-only; the writable equivalent needs verification.
         """
-        mode_map = {
-            HVACMode.HEAT: 1,
-            HVACMode.COOL: 2,
-            HVACMode.OFF: 0,
-            HVACMode.AUTO: 4,
-        }
-        if hvac_mode not in mode_map:
-            _LOGGER.error("Unsupported HVAC mode for Zone 1: %s", hvac_mode)
+        mode_value = _HVAC_TO_REG_VALUE.get(hvac_mode)
+        if mode_value is None:
+            _LOGGER.error("Unsupported HVAC mode for %s: %s", self._zone_name, hvac_mode)
             return
-        mode_value = mode_map[hvac_mode]
         # TODO: Replace register_id with the confirmed writable operating mode register
         # from the Chofu/Grant Modbus documentation once identified.
-        _LOGGER.info("Set Zone 1 HVAC mode to %s (value %d) — verify writable register", hvac_mode, mode_value)
+        _LOGGER.info("Set %s HVAC mode to %s (value %d) — verify writable register", self._zone_name, hvac_mode, mode_value)
 
     async def async_turn_on(self) -> None:
-        """Turn Zone 1 on (set to HEAT mode)."""
+        """Turn the zone on (set to HEAT mode)."""
         await self.async_set_hvac_mode(HVACMode.HEAT)
 
     async def async_turn_off(self) -> None:
-        """Turn Zone 1 off."""
+        """Turn the zone off."""
         await self.async_set_hvac_mode(HVACMode.OFF)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return {}
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        return {
-            "zone": "Zone 1",
-            "flow_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 9),
-            "return_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 0),
-            "outdoor_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 6),
-            "compressor_frequency": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 1),
-            "current_power": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3),
-            "operation_mode": OPERATING_MODES.get(input_regs.get(10, 0), "Unknown"),
-            "heating_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 2),
-            "cooling_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 12),
-            "max_heating_temp": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 3),
-            "min_heating_temp": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 4),
-            "plate_heat_exchanger_temp": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 32),
-        }
-
-class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
-    """Climate entity for Zone 2."""
-
-    def __init__(self, coordinator, config_entry):
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Zone 2"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_zone_2"
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
-        )
-        self._attr_hvac_modes = [
-            HVACMode.OFF,
-            HVACMode.HEAT,
-            HVACMode.COOL,
-            HVACMode.AUTO,
-        ]
-        min_temp, max_temp, step = get_reg_min_max_step(7)
-        self._attr_min_temp = min_temp
-        self._attr_max_temp = max_temp
-        self._attr_target_temperature_step = step
-
-    @property
-    def target_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
-            return None
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        current_mode = self._get_current_mode()
-        if current_mode == "heating":
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 7)
-        elif current_mode == "cooling":
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 17)
-        else:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 7)
-        if target is not None and target > 0:
-            return round(target, 1)
-        return self._attr_min_temp
-
-    @property
-    def current_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
-            return None
-        input_regs = self.coordinator.data.get("input_registers", {})
-        room_temp = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 12)
-        if room_temp is not None and room_temp > 0:
-            return round(room_temp, 1)
-        return_temp = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 0)
-        if return_temp is not None and return_temp > 0:
-            return round(return_temp, 1)
-        return 21.0
+        attrs: Dict[str, Any] = {"zone": self._zone_name}
+        for name, idx, reg_id, scale in self._ATTR_PLAN:
+            value = regs[idx].get(reg_id)
+            attrs[name] = value * scale if value is not None else None
+        return attrs
 
-    def _get_current_mode(self) -> str:
-        if not self.coordinator.data:
-            return "heating"
-        input_regs = self.coordinator.data.get("input_registers", {})
-        mode = input_regs.get(10, 1)
-        if mode == 1:
-            return "heating"
-        elif mode == 2:
-            return "cooling"
-        else:
-            return "heating"
+class GrantAerona3MainZoneClimate(GrantAerona3ZoneClimate):
+    """Climate entity for main heating zone (Zone 1)."""
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        if not self.coordinator.data:
-            return HVACMode.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        mode = input_regs.get(10, 0)
-        power = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3)
-        frequency = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 1)
-        if mode == 0 or ((power or 0) < 100 and (frequency or 0) == 0):
-            return HVACMode.OFF
-        elif mode == 1:
-            return HVACMode.HEAT
-        elif mode == 2:
-            return HVACMode.COOL
-        else:
-            return HVACMode.OFF
+    __slots__ = ()
+
+    _zone_name = "Zone 1"
+    _zone_slug = "zone_1"
+    _room_temp_reg = 11
+    _SETPOINT_REGS = {"heating": 2, "cooling": 12}
+    _ATTR_PLAN = _compile_attr_plan(
+        ("flow_temperature", "i", 9),
+        ("return_temperature", "i", 0),
+        ("outdoor_temperature", "i", 6),
+        ("compressor_frequency", "i", 1),
+        ("current_power", "i", 3),
+        ("heating_setpoint", "h", 2),
+        ("cooling_setpoint", "h", 12),
+        ("max_heating_temp", "h", 3),
+        ("min_heating_temp", "h", 4),
+        ("plate_heat_exchanger_temp", "i", 32),
+    )
 
     @property
-    def hvac_action(self) -> HVACAction:
-        if not self.coordinator.data:
-            return HVACAction.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        frequency = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 1)
-        power = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3)
-        mode = input_regs.get(10, 1)
-        if (frequency or 0) > 0 or (power or 0) > 200:
-            if mode == 2:
-                return HVACAction.COOLING
-            else:
-                return HVACAction.HEATING
-        else:
-            return HVACAction.IDLE
-
-    async def async_set_temperature(self, **kwargs: Any) -> None:
-        temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is None:
-            return
-        scale = HOLDING_REGISTER_MAP[7].get("scale", 1)
-        register_value = int(temperature / scale)
-        current_mode = self._get_current_mode()
-        register_id = 7 if current_mode == "heating" else 17
-        success = await self.coordinator.async_write_register(register_id, register_value)
-        if success:
-            _LOGGER.info("Set Zone 2 target temperature to %s°C (register %d)", temperature, register_id)
-        else:
-            _LOGGER.error("Failed to set Zone 2 target temperature to %s°C", temperature)
-
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """Set HVAC mode for Zone 2.
-
-        FIX: This method was missing — HVAC mode buttons had no effect.
-        """
-        mode_map = {
-            HVACMode.HEAT: 1,
-            HVACMode.COOL: 2,
-            HVACMode.OFF: 0,
-            HVACMode.AUTO: 4,
-        }
-        if hvac_mode not in mode_map:
-            _LOGGER.error("Unsupported HVAC mode for Zone 2: %s", hvac_mode)
-            return
-        mode_value = mode_map[hvac_mode]
-        _LOGGER.info("Set Zone 2 HVAC mode to %s (value %d) — verify writable register", hvac_mode, mode_value)
-
-    async def async_turn_on(self) -> None:
-        """Turn Zone 2 on (set to HEAT mode)."""
-        await self.async_set_hvac_mode(HVACMode.HEAT)
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        attrs = super().extra_state_attributes
+        if attrs:
+            mode = self._regs()[0].get(10, 0)
+            attrs["operation_mode"] = (
+                OPERATING_MODES[mode] if 0 <= mode < _N_OP_MODES else "Unknown"
+            )
+        return attrs
 
-    async def async_turn_off(self) -> None:
-        """Turn Zone 2 off."""
-        await self.async_set_hvac_mode(HVACMode.OFF)
+class GrantAerona3Zone2Climate(GrantAerona3ZoneClimate):
+    """Climate entity for Zone 2."""
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        if not self.coordinator.data:
-            return {}
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        return {
-            "zone": "Zone 2",
-            "flow_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 9),
-            "return_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 0),
-            "outdoor_temperature": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 6),
-            "heating_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 7),
-            "cooling_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 17),
-            "max_heating_temp": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 8),
-            "min_heating_temp": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 9),
-        }
+    __slots__ = ()
+
+    _zone_name = "Zone 2"
+    _zone_slug = "zone_2"
+    _room_temp_reg = 12
+    _SETPOINT_REGS = {"heating": 7, "cooling": 17}
+    _ATTR_PLAN = _compile_attr_plan(
+        ("flow_temperature", "i", 9),
+        ("return_temperature", "i", 0),
+        ("outdoor_temperature", "i", 6),
+        ("heating_setpoint", "h", 7),
+        ("cooling_setpoint", "h", 17),
+        ("max_heating_temp", "h", 8),
+        ("min_heating_temp", "h", 9),
+    )
 
 class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
     """Climate entity for DHW (Domestic Hot Water) control."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator, config_entry):
         super().__init__(coordinator, config_entry)
         self._attr_name = "ASHP DHW Tank"
@@ -422,39 +424,32 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
 
     @property
     def current_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return None
-        input_regs = self.coordinator.data.get("input_registers", {})
-        temp = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 16)
+        temp = regs[0].get(16)
         if temp is not None and temp > 0:
-            return round(temp, 1)
+            return temp / _INV_SCALE_INPUT[16]
         return 50.0
 
     @property
     def target_temperature(self) -> Optional[float]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return None
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        input_regs = self.coordinator.data.get("input_registers", {})
-        dhw_mode = input_regs.get(13, 1) if input_regs else 1
-        if dhw_mode == 1:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 28)
-        elif dhw_mode == 2:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 29)
-        elif dhw_mode == 3:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 31)
-        else:
-            target = get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 28)
+        input_regs, holding_regs = regs
+        register_id = _DHW_TARGET_REG.get(input_regs.get(13, 1), 28)
+        target = holding_regs.get(register_id)
         if target is not None and target > 0:
-            return round(target, 1)
+            return target / _INV_SCALE_HOLDING[register_id]
         return self._attr_min_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return HVACMode.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        input_regs, holding_regs = regs
         dhw_priority = holding_regs.get(26, 0)
         dhw_mode = input_regs.get(13, 0)
         if dhw_priority > 0 and dhw_mode > 0:
@@ -464,13 +459,26 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
 
     @property
     def hvac_action(self) -> HVACAction:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return HVACAction.OFF
-        input_regs = self.coordinator.data.get("input_registers", {})
-        current_temp = self.current_temperature or 0
-        target_temp = self.target_temperature or 0
-        power = get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3)
-        if current_temp < target_temp - 1 and (power or 0) > 200:
+        input_regs, holding_regs = regs
+        # One pass over the snapshot: tank temp, mode-selected target and
+        # power, instead of re-entering the temperature properties (each of
+        # which redoes the availability checks and dict walks)
+        tank_raw = input_regs.get(16)
+        if tank_raw is not None and tank_raw > 0:
+            current_temp = tank_raw / _INV_SCALE_INPUT[16]
+        else:
+            current_temp = 50.0
+        register_id = _DHW_TARGET_REG.get(input_regs.get(13, 1), 28)
+        target_raw = holding_regs.get(register_id)
+        if target_raw is not None and target_raw > 0:
+            target_temp = target_raw / _INV_SCALE_HOLDING[register_id]
+        else:
+            target_temp = self._attr_min_temp or 0
+        power = _get_scaled_or_zero(input_regs, INPUT_SCALES, 3)
+        if current_temp < target_temp - 1 and power > 200:
             return HVACAction.HEATING
         elif current_temp >= target_temp:
             return HVACAction.IDLE
@@ -488,16 +496,9 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
             )
             return
         register_value = int(temperature * 10)
-        input_regs = self.coordinator.data.get("input_registers", {}) if self.coordinator.data else {}
-        dhw_mode = input_regs.get(13, 1)
-        if dhw_mode == 1:
-            register_id = 28
-        elif dhw_mode == 2:
-            register_id = 29
-        elif dhw_mode == 3:
-            register_id = 31
-        else:
-            register_id = 28
+        regs = self._regs()
+        dhw_mode = regs[0].get(13, 1) if regs else 1
+        register_id = _DHW_TARGET_REG.get(dhw_mode, 28)
         success = await self.coordinator.async_write_register(register_id, register_value)
         if success:
             _LOGGER.info("Set DHW target temperature to %s°C (register %d, mode %d)", temperature, register_id, dhw_mode)
@@ -522,24 +523,18 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        if not self.coordinator.data:
+        regs = self._regs()
+        if regs is None:
             return {}
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        dhw_modes = {
-            0: "Off",
-            1: "Comfort",
-            2: "Economy", 
-            3: "Boost"
-        }
+        input_regs, holding_regs = regs
         return {
-            "dhw_mode": dhw_modes.get(input_regs.get(13, 0), "Unknown"),
+            "dhw_mode": _DHW_MODES_GET(input_regs.get(13, 0), "Unknown"),
             "tank_temperature": self.current_temperature,
             "heating_active": self.hvac_action == HVACAction.HEATING,
-            "power_consumption": get_scaled_register(input_regs, INPUT_REGISTER_MAP, 3),
+            "power_consumption": get_scaled_register(input_regs, INPUT_SCALES, 3),
             "dhw_priority": holding_regs.get(26, 0),
-            "comfort_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 28),
-            "economy_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 29),
-            "boost_setpoint": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 31),
-            "dhw_hysteresis": get_scaled_register(holding_regs, HOLDING_REGISTER_MAP, 30),
+            "comfort_setpoint": get_scaled_register(holding_regs, HOLDING_SCALES, 28),
+            "economy_setpoint": get_scaled_register(holding_regs, HOLDING_SCALES, 29),
+            "boost_setpoint": get_scaled_register(holding_regs, HOLDING_SCALES, 31),
+            "dhw_hysteresis": get_scaled_register(holding_regs, HOLDING_SCALES, 30),
         }
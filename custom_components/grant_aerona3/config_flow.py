@@ -1,11 +1,12 @@
 """Config flow for Grant Aerona3 Heat Pump integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import voluptuous as vol
-from pymodbus.client import ModbusTcpClient, ModbusSerialClient
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from homeassistant import config_entries
@@ -35,13 +36,27 @@ _LOGGER = logging.getLogger(__name__)
 
 INTEGRATION_VERSION = "1.1.1"
 
+# The coordinator polls input registers 0-19 as its core block; probing the
+# same span costs one round trip just like a single-register read and also
+# verifies the expected block is present on this unit
+PROBE_REGISTER_COUNT = 20
+
+# How long a validated connection may wait in hass.data for setup to adopt
+# it before it is closed (covers users abandoning the form)
+PENDING_CLIENT_TTL = 30
+
+# Validator chains built once and shared with the options flow, instead of
+# being reconstructed on every Schema build / form render
+UNIT_ID_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=247))
+SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=5, max=3600))
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CONNECTION_TYPE, default="tcp"): vol.In(["tcp", "serial"]),
         vol.Optional(CONF_HOST, default=""): cv.string,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
-        vol.Required(CONF_UNIT_ID, default=DEFAULT_UNIT_ID): vol.All(vol.Coerce(int), vol.Range(min=1, max=247)),
-        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+        vol.Required(CONF_UNIT_ID, default=DEFAULT_UNIT_ID): UNIT_ID_VALIDATOR,
+        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): SCAN_INTERVAL_VALIDATOR,
         # Serial options - only used if connection_type == 'serial'
         vol.Optional(CONF_SERIAL_PORT, default="/dev/ttyUSB0"): cv.string,
         vol.Optional(CONF_BAUDRATE, default=19200): vol.All(vol.Coerce(int)),
@@ -53,81 +68,128 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _build_tcp_entry(data: dict[str, Any]) -> dict[str, Any]:
+    """Build the config entry payload for a TCP connection."""
+    host = data.get(CONF_HOST, "")
+    return {
+        "title": f"ASHP Grant Aerona3 ({host})",
+        "connection_type": "tcp",
+        "unit_id": data[CONF_UNIT_ID],
+        "scan_interval": data[CONF_SCAN_INTERVAL],
+        "host": host,
+        "port": data.get(CONF_PORT, DEFAULT_PORT),
+    }
+
+
+def _build_serial_entry(data: dict[str, Any]) -> dict[str, Any]:
+    """Build the config entry payload for a serial connection."""
+    serial_port = data.get(CONF_SERIAL_PORT)
+    return {
+        "title": f"ASHP Grant Aerona3 ({serial_port})",
+        "connection_type": "serial",
+        "unit_id": data[CONF_UNIT_ID],
+        "scan_interval": data[CONF_SCAN_INTERVAL],
+        "serial_port": serial_port,
+        "baudrate": data.get(CONF_BAUDRATE),
+        "bytesize": data.get(CONF_BYTESIZE),
+        "method": data.get(CONF_METHOD),
+        "parity": data.get(CONF_PARITY),
+        "stopbits": data.get(CONF_STOPBITS),
+    }
+
+
+def _stash_pending_client(hass: HomeAssistant, key: tuple, client) -> None:
+    """Park a validated, connected client for setup to adopt.
+
+    Closed automatically after PENDING_CLIENT_TTL seconds if nothing claims
+    it, so an abandoned config form can't leak a socket.
+    """
+    pending = hass.data.setdefault(DOMAIN, {}).setdefault("pending_clients", {})
+    stale = pending.pop(key, None)
+    if stale is not None:
+        stale.close()
+    pending[key] = client
+
+    def _expire() -> None:
+        if pending.get(key) is client:
+            pending.pop(key)
+            client.close()
+
+    hass.loop.call_later(PENDING_CLIENT_TTL, _expire)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
     connection_type = data.get(CONF_CONNECTION_TYPE, "tcp")
-    host = data.get(CONF_HOST, "")
-    port = data.get(CONF_PORT, DEFAULT_PORT)
     unit_id = data[CONF_UNIT_ID]
-    serial_port = data.get(CONF_SERIAL_PORT)
-    baudrate = data.get(CONF_BAUDRATE)
-    bytesize = data.get(CONF_BYTESIZE)
-    method = data.get(CONF_METHOD)
-    parity = data.get(CONF_PARITY)
-    stopbits = data.get(CONF_STOPBITS)
 
-    # Test the connection
-    if connection_type == "tcp":
-        if not host:
-            raise CannotConnect("Host required for TCP connection")
-        client = ModbusTcpClient(host=host, port=port, timeout=5)
-    else:
-        client = ModbusSerialClient(
-            method=method,
-            port=serial_port,
-            baudrate=baudrate,
-            bytesize=bytesize,
-            parity=parity,
-            stopbits=stopbits,
-            timeout=5,
-        )
+    # Test the connection. Both transports probe on the event loop with the
+    # async clients - no SyncWorker threads are occupied per submission.
+    async def _probe(client, keep_open=False) -> None:
+        ok = False
+        try:
+            if not await client.connect():
+                raise CannotConnect("Failed to connect to heat pump")
+
+            # Read the coordinator's core block to verify communication
+            result = await client.read_input_registers(
+                address=0, count=PROBE_REGISTER_COUNT, device_id=unit_id
+            )
+            if result.isError() or len(result.registers) != PROBE_REGISTER_COUNT:
+                raise CannotConnect("Failed to read from heat pump - check Unit ID")
+            ok = True
+        finally:
+            if not (ok and keep_open):
+                client.close()
 
     try:
-        if not await hass.async_add_executor_job(client.connect):
-            raise CannotConnect("Failed to connect to heat pump")
-
-        # Try to read a register to verify communication
-        result = await hass.async_add_executor_job(
-            lambda: client.read_input_registers(address=0, count=1, device_id=unit_id)
-        )
-
-        if result.isError():
-            raise CannotConnect("Failed to read from heat pump - check Unit ID")
-
-        _LOGGER.info("Successfully connected to Grant Aerona3 (%s)", "serial" if connection_type == "serial" else f"{host}:{port}")
-
+        if connection_type == "tcp":
+            host = data.get(CONF_HOST, "")
+            port = data.get(CONF_PORT, DEFAULT_PORT)
+            if not host:
+                raise CannotConnect("Host required for TCP connection")
+            client = AsyncModbusTcpClient(host, port=port, timeout=5)
+            await _probe(client, keep_open=True)
+            # Leave the live connection for async_setup_entry instead of
+            # making the first coordinator poll reconnect seconds later
+            _stash_pending_client(hass, (host, port, unit_id), client)
+            target = f"{host}:{port}"
+        else:
+            await _probe(
+                AsyncModbusSerialClient(
+                    method=data.get(CONF_METHOD),
+                    port=data.get(CONF_SERIAL_PORT),
+                    baudrate=data.get(CONF_BAUDRATE),
+                    bytesize=data.get(CONF_BYTESIZE),
+                    parity=data.get(CONF_PARITY),
+                    stopbits=data.get(CONF_STOPBITS),
+                    timeout=5,
+                )
+            )
+            target = "serial"
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Successfully connected to Grant Aerona3 (%s)", target)
+    except CannotConnect:
+        raise
     except ModbusException as err:
         _LOGGER.error("Modbus error connecting - %s", err)
         raise CannotConnect(f"Modbus communication error: {err}") from err
-    except Exception as err:
-        _LOGGER.error("Unexpected error connecting - %s", err)
-        raise CannotConnect(f"Unexpected error: {err}") from err
-    finally:
-        await hass.async_add_executor_job(client.close)
-
-    # Return info that you want to store in the config entry.
-    # Store relevant values depending on connection type
-    base = {
-        "title": f"ASHP Grant Aerona3 ({serial_port if connection_type=='serial' else host})",
-        "connection_type": connection_type,
-        "unit_id": unit_id,
-        "scan_interval": data[CONF_SCAN_INTERVAL],
-    }
+    except (OSError, asyncio.TimeoutError, ConnectionError) as err:
+        # Expected transport failures (refused, unreachable, timeout): the
+        # form shows cannot_connect, so debug logging is enough here.
+        # Anything truly unexpected propagates to async_step_user's broad
+        # handler and its "unknown" bucket.
+        _LOGGER.debug("Connection error while validating - %s", err)
+        raise CannotConnect(f"Connection error: {err}") from err
+
+    # Return info that you want to store in the config entry. Each transport
+    # has its own builder so only the relevant keys are ever looked up.
     if connection_type == "tcp":
-        base.update({"host": host, "port": port})
-    else:
-        base.update({
-            "serial_port": serial_port,
-            "baudrate": baudrate,
-            "bytesize": bytesize,
-            "method": method,
-            "parity": parity,
-            "stopbits": stopbits,
-        })
-    return base
+        return _build_tcp_entry(data)
+    return _build_serial_entry(data)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -157,11 +219,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Check if already configured
+                # Check if already configured. The unit ID is part of the
+                # unique ID so several slaves behind one TCP/RTU gateway can
+                # each get their own entry.
                 if user_input.get(CONF_CONNECTION_TYPE) == "serial":
-                    unique = f"serial:{user_input.get(CONF_SERIAL_PORT)}"
+                    unique = f"serial:{user_input.get(CONF_SERIAL_PORT)}:{user_input.get(CONF_UNIT_ID)}"
                 else:
-                    unique = f"{user_input.get(CONF_HOST)}:{user_input.get(CONF_PORT)}"
+                    unique = f"{user_input.get(CONF_HOST)}:{user_input.get(CONF_PORT)}:{user_input.get(CONF_UNIT_ID)}"
                 await self.async_set_unique_id(unique)
                 self._abort_if_unique_id_configured()
 
@@ -1,4 +1,7 @@
 """Constants for Grant Aerona3 Heat Pump integration with ASHP prefixes."""
+import sys
+from types import MappingProxyType
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.const import (
@@ -17,33 +20,27 @@ DOMAIN = "grant_aerona3"
 MANUFACTURER = "Grant"
 MODEL = "Aerona3"
 
-# Operating modes
-OPERATING_MODES = {
-    0: "Off",
-    1: "Heating",
-    2: "Cooling", 
-    3: "DHW",
-    4: "Auto"
-}
+# Enum code translations. The codes are dense 0..N, so these are tuples
+# indexed by the raw register value - a plain sequence index instead of a
+# dict hash on every state update. Guard with a bounds check when the raw
+# value comes off the wire.
 
-# DHW (Domestic Hot Water) modes
-DHW_MODES = {
-    0: "Off",
-    1: "Comfort",
-    2: "Economy",
-    3: "Boost"
-}
+# Operating modes (0=Off, 1=Heating, 2=Cooling, 3=DHW, 4=Auto)
+OPERATING_MODES = ("Off", "Heating", "Cooling", "DHW", "Auto")
 
-# Days of the week
-DAYS_OF_WEEK = {
-    0: "Monday",
-    1: "Tuesday", 
-    2: "Wednesday",
-    3: "Thursday",
-    4: "Friday",
-    5: "Saturday",
-    6: "Sunday"
-}
+# DHW (Domestic Hot Water) modes (0=Off, 1=Comfort, 2=Economy, 3=Boost)
+DHW_MODES = ("Off", "Comfort", "Economy", "Boost")
+
+# Days of the week (0=Monday .. 6=Sunday)
+DAYS_OF_WEEK = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
 
 # Climate modes mapping
 CLIMATE_MODES = {
@@ -53,25 +50,25 @@ CLIMATE_MODES = {
     "auto": 4
 }
 
-# Error codes mapping
-ERROR_CODES = {
-    0: "No Error",
-    1: "High Pressure",
-    2: "Low Pressure", 
-    3: "Compressor Overload",
-    4: "Fan Motor Error",
-    5: "Water Flow Error",
-    6: "Temperature Sensor Error",
-    7: "Communication Error",
-    8: "Outdoor Sensor Error",
-    9: "Indoor Sensor Error",
-    10: "Flow Sensor Error",
-    11: "Return Sensor Error",
-    12: "DHW Sensor Error",
-    13: "Buffer Tank Sensor Error",
-    14: "Mix Water Sensor Error",
-    15: "Defrost Sensor Error"
-}
+# Error codes mapping (indexed by code 0-15)
+ERROR_CODES = (
+    "No Error",
+    "High Pressure",
+    "Low Pressure",
+    "Compressor Overload",
+    "Fan Motor Error",
+    "Water Flow Error",
+    "Temperature Sensor Error",
+    "Communication Error",
+    "Outdoor Sensor Error",
+    "Indoor Sensor Error",
+    "Flow Sensor Error",
+    "Return Sensor Error",
+    "DHW Sensor Error",
+    "Buffer Tank Sensor Error",
+    "Mix Water Sensor Error",
+    "Defrost Sensor Error",
+)
 
 # Configuration keys
 CONF_HOST = "host"
@@ -96,15 +93,26 @@ INPUT_REGISTERS = "input"
 HOLDING_REGISTERS = "holding"
 COIL_REGISTERS = "coil"
 
+# Shared key group for the plain (scale 1) temperature sensor entries.
+# Spread with ** below so each entry copies the slots instead of repeating
+# the same unit/device_class/state_class literals per register.
+_TEMP_SENSOR = {
+    "unit": UnitOfTemperature.CELSIUS,
+    "device_class": SensorDeviceClass.TEMPERATURE,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "scale": 1,
+    "offset": 0,
+}
+
+# Variant for the 0.1-scaled temperature sensors (room setpoints and the
+# Terminal tank/remote probes)
+_TEMP_SENSOR_01 = {**_TEMP_SENSOR, "scale": 0.1}
+
 # INPUT REGISTERS - Temperature and sensor readings
 INPUT_REGISTER_MAP = {
     0: {
+        **_TEMP_SENSOR,
         "name": "Return Water Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Return water temperature"
     },
     1: {
@@ -117,12 +125,8 @@ INPUT_REGISTER_MAP = {
         "description": "Compressor operating frequency"
     },
     2: {
+        **_TEMP_SENSOR,
         "name": "Discharge Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Discharge temperature"
     },
     3: {
@@ -144,21 +148,13 @@ INPUT_REGISTER_MAP = {
         "description": "Fan control number of rotation"
     },
     5: {
+        **_TEMP_SENSOR,
         "name": "Defrost Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Defrost temperature"
     },
     6: {
+        **_TEMP_SENSOR,
         "name": "Outdoor Air Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Outdoor air temperature"
     },
     7: {
@@ -171,21 +167,13 @@ INPUT_REGISTER_MAP = {
         "description": "Water pump control number of rotation"
     },
     8: {
+        **_TEMP_SENSOR,
         "name": "Suction Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Suction temperature"
     },
     9: {
+        **_TEMP_SENSOR,
         "name": "Outgoing Water Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Outgoing water temperature"
     },
     10: {
@@ -198,21 +186,13 @@ INPUT_REGISTER_MAP = {
         "description": "Selected operating mode (0=Heating/Cooling OFF, 1=Heating, 2=Cooling)"
     },
     11: {
+        **_TEMP_SENSOR_01,
         "name": "Room Air Set Temperature of Zone 1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "Room air set temperature of Zone1(Master)"
     },
     12: {
+        **_TEMP_SENSOR_01,
         "name": "Room Air Set Temperature Of Zone 2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "Room air set temperature of Zone2(Slave)"
     },
   
@@ -244,1343 +224,717 @@ INPUT_REGISTER_MAP = {
         "description": "Legionella Cycle (0=Not Running, 1=Running)"
     },
     16: {
+        **_TEMP_SENSOR_01,
         "name": "DHW Tank Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "DHW tank temperature (Terminal 7-8)"
     },
     17: {
+        **_TEMP_SENSOR_01,
         "name": "Outdoor Air Temperature - Remote Sensor",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "Outdoor air temperature (Terminal 9-10)"
     },
     18: {
+        **_TEMP_SENSOR_01,
         "name": "Buffer Tank Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "Buffer tank temperature (Terminal 11-12)"
     },
     19: {
+        **_TEMP_SENSOR_01,
         "name": "Mix Water Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 0.1,
-        "offset": 0,
         "description": "Mix water temperature (Terminal 13-14)"
     },
     32: {
+        **_TEMP_SENSOR,
         "name": "Plate Heat Exchanger Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "scale": 1,
-        "offset": 0,
         "description": "Plate heat exchanger temperature"
     },
 }
 
-# Holding Registers (Read/Write configuration settings)
+# Flat register-id -> scale lookup so hot paths don't walk the nested map
+INPUT_SCALES = {
+    reg_id: info.get("scale", 1) for reg_id, info in INPUT_REGISTER_MAP.items()
+}
+
+# Holding Registers (Read/Write configuration settings). The entries all
+# share one of a handful of unit/device-class shapes, so the map is built
+# from a compact spec table instead of ~1100 lines of dict literals: one
+# row per register of (addr, name, kind, min, max, step, description),
+# with None meaning the key is omitted from the entry.
+_HOLDING_KINDS = {
+    # kind: (unit, device_class, scale)
+    "temp": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, 0.1),
+    "temp_raw": (UnitOfTemperature.CELSIUS, None, 0.1),
+    "seconds": ("s", SensorDeviceClass.DURATION, 1),
+    "minutes": ("min", SensorDeviceClass.DURATION, 1),
+    "hours": ("h", SensorDeviceClass.DURATION, 1),
+    "plain": (None, None, 1),
+    "percent": (PERCENTAGE, SensorDeviceClass.HUMIDITY, 1),
+    "frequency": (UnitOfFrequency.HERTZ, SensorDeviceClass.FREQUENCY, 1),
+}
+
+_HOLDING_SPEC = (
+    (2, 'Fixed Flow Temp Zone 1', 'temp', 23.0, 60.0, 0.5,
+     'Heating Zone1, Fixed Outgoing water set point in Heating'),
+    (3, 'Max Flow Temp Zone1', 'temp', 23.0, 60.0, 0.5,
+     'Max. Outgoing water temperature in Heating mode (Tm1) Zone1'),
+    (4, 'Min Flow Temp Zone1', 'temp', 23.0, 60.0, 0.5,
+     'Min. Outgoing water temperature in Heating mode (Tm2) Zone1'),
+    (5, 'Min Outdoor Air Temperature Zone1', 'temp', -20.0, 50.0, 0.5,
+     'Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone1'),
+    (6, 'Max Outdoor Air Temperature Zone1', 'temp', 0.0, 40.0, 0.5,
+     'Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone1'),
+    (7, 'Fixed Flow Temp Zone 2', 'temp_raw', 23.0, 60.0, 0.5,
+     'Heating Zone2, Fixed Outgoing water set point in Heating'),
+    (8, 'Max Flow Temp Zone2', 'temp', 23.0, 60.0, 0.5,
+     'Max. Outgoing water temperature in Heating mode (Tm1) Zone2'),
+    (9, 'Min Flow Temp Zone2', 'temp', 23.0, 60.0, 0.5,
+     'Min. Outgoing water temperature in Heating mode (Tm2) Zone2'),
+    (10, 'Min Outdoor Air Temperature Zone2', 'temp', -20.0, 50.0, 0.5,
+     'Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone2'),
+    (11, 'Max Outdoor Air Temperature Zone2', 'temp', 0.0, 40.0, 0.5,
+     'Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone2'),
+    (12, 'Cooling Fixed Flow Temp Zone 1', 'temp_raw', 7.0, 23.0, 0.5,
+     'Cooling Zone1, Fixed Outgoing water set point in Cooling'),
+    (13, 'Max. Flow Temperature In Cooling Mode', 'temp', 7.0, 23.0, 0.5,
+     'Max. Outgoing water temperature in Cooling mode (Tm1) Zone1'),
+    (14, 'Min. Flow Water Temperature In Cooling Mode', 'temp', 7.0, 23.0, 0.5,
+     'Min. Outgoing water temperature in Cooling mode (Tm2) Zone1'),
+    (15, 'Min. Outdoor Air Temperature Cooling Zone1', 'temp', 0.0, 50.0, 0.5,
+     'Min. Outdoor air temperature corresponding to min. Outgoing water temperature Cooling (Te1) Zone1'),
+    (16, 'Max. Outdoor Air Temperature Corresponding To max. Outgoing water temperature Cooling (Te2) Zone1', 'temp', 0.0, 50.0, 0.5,
+     'Max. Outdoor air temperature corresponding to max. Outgoing water temperature Cooling (Te2) Zone1'),
+    (17, 'Cooling Fixed Flow Temp Zone2', 'temp_raw', 7.0, 23.0, 0.5,
+     'Cooling Zone2, Fixed Outgoing water set point in Cooling'),
+    (18, 'Max Flow Temperature In Cooling Mode 2', 'temp', 7.0, 23.0, 0.5,
+     'Max. Outgoing water temperature in Cooling mode (Tm1) Zone2'),
+    (19, 'Min Flow Temperature In Cooling Mode 2', 'temp', 7.0, 23.0, 0.5,
+     'Min. Outgoing water temperature in Cooling mode (Tm2) Zone2'),
+    (20, 'Min Outdoor Air Temperature Cooling Zone2', 'temp', 0.0, 50.0, 0.5,
+     'Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone2'),
+    (21, 'Max. Outdoor Air Temperature Cooling Zone2', 'temp', 0.0, 50.0, 0.5,
+     'Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone2'),
+    (22, 'Hysteresis Of Water Set Point In Heating And DHW', 'temp_raw', 0.5, 10.0, 0.5,
+     'Hysteresis of water set point in Heating and DHW'),
+    (23, 'Hysteresis Of Water Set Point In Cooling', 'temp', 0.5, 10.0, 0.5,
+     'Hysteresis of water set point in Cooling'),
+    (24, 'Low Tariff Deferential Water Set Point For Heating', 'temp', 0.0, 60.0, 0.5,
+     'Low tariff deferential water set point for Heating'),
+    (25, 'Low Tariff Deferential Water Set Point For Cooling', 'temp', 0.0, 60.0, 0.5,
+     'Low tariff deferential water set point for Cooling'),
+    (26, 'DHW Production Priority Setting', 'plain', 0.0, 2.0, None,
+     'DHW production priority setting (0=DHW is unavailable, 1=DHW is available and priority DHW over space Heating, 2=DHW is available and priority space Heating over DHW)'),
+    (27, 'Type Of Configuration To Heat The DHW', 'plain', 0.0, 2.0, None,
+     'Type of configuration to heat the DHW (0=Heat pump + Heater, 1=Heat pump only, 2=Heater only)'),
+    (28, 'DHW Comfort Set Temperature', 'temp', 40.0, 60.0, 0.5,
+     'DHW Comfort set temperature'),
+    (29, 'DHW Economy Set Temperature', 'temp', 30.0, 50.0, 0.5,
+     'DHW Economy set temperature'),
+    (30, 'DHW Set Point Hysteresis', 'temp', 0.5, 10.0, 0.5,
+     'DHW set point hysteresis'),
+    (31, 'DHW Over Boost Mode Set Point', 'temp', 50.0, 90.0, 0.5,
+     'DHW Over boost mode set point'),
+    (32, 'Max. Time For DHW Request', 'minutes', 0.0, 900.0, 1.0,
+     'Max. time for DHW request'),
+    (33, 'Delay Time On DHW Heater From Off Compressor', 'minutes', None, None, 1.0,
+     'Delay time on DHW heater from OFF compressor'),
+    (34, 'Outdoor Air Temperature To Enable DHW Heaters', 'temp', -20.0, 20.0, 0.5,
+     'Outdoor air temperature to enable DHW heaters'),
+    (35, 'Outdoor Air Temperature Hysteresis To Disable DHW Heaters', 'temp', 0.5, 10.0, 0.5,
+     'Outdoor air temperature hysteresis to disable DHW heaters'),
+    (36, 'Anti-legionella Set Point', 'temp', None, None, 0.5,
+     'Anti-legionella set point'),
+    (37, 'Max. Frequency Of Night Mode', 'frequency', 20.0, 100.0, 5.0,
+     'Max. frequency of Night mode'),
+    (38, 'Min. Time Compressor On/off Time', 'seconds', 0.0, 0.0, 1.0,
+     'Min. time compressor ON/OFF time'),
+    (39, 'Delay Time Pump Off From Compressor Off', 'seconds', 0.0, 900.0, 1.0,
+     'Delay time pump OFF from compressor OFF'),
+    (40, 'Delay Time Compressor On From Pump On', 'seconds', 0.0, 900.0, 1.0,
+     'Delay time compressor ON from pump ON'),
+    (41, 'Type Of Configuration Of Main Water Pump', 'plain', 0.0, 2.0, None,
+     'Type of configuration of Main water pump (0=always ON, 1=ON/OFF based on Buffertank temperature, 2=ON/OFF based on Sniffing cycles'),
+    (42, 'Time On Main Water Pump For Sniffing Cycle', 'minutes', 1.0, 15.0, 1.0,
+     'Time ON Main water pump for Sniffing cycle'),
+    (43, 'Time Off Main Water Pump', 'minutes', 5.0, 30.0, 1.0,
+     'Time OFF Main water pump'),
+    (44, 'Delay Time Off Main Water Pump From Off Compressor', 'minutes', 1.0, 15.0, 1.0,
+     'Delay time OFF Main water pump from OFF compressor'),
+    (45, 'Off Time For Unlock Pump Function Start', 'hours', 0.0, 240.0, 1.0,
+     'OFF time for Unlock pump function start'),
+    (46, 'Time On Main Water Pump For Unlock Pump Function', 'seconds', 0.0, 10.0, 1.0,
+     'Time ON Main water pump for Unlock pump function'),
+    (47, 'Time On Water Pump1 For Unlock Pump Function', 'seconds', 0.0, 10.0, 1.0,
+     'Time ON water pump1 for Unlock pump function'),
+    (48, 'Time On Water Pump2 For Unlock Pump Function', 'seconds', 0.0, 10.0, 1.0,
+     'Time ON water pump2 for Unlock pump function'),
+    (49, 'Type Of Operation Of Additional Water Pump', 'plain', 0.0, 4.0, None,
+     'Type of operation of additional water pump (0=disable, 1=depending on Main water pump setting, 2=depending on Main water pump setting but always OFF when the DHW mode is activated, 3=always ON apart if any alarms are activated or if the HP unit is in OFF mode, 4=ON/OFF based on Room air temperature)'),
+    (50, 'Start Temperature Of Frost Protection On Room Air Temp', 'temp', 0.0, 40.0, 0.5,
+     'Start temperature of Frost protection on Room air temperature'),
+    (51, 'Hysteresis Of Room Air Temperature Of Frost Protection', 'temp', 0.5, 5.0, 0.5,
+     'Hysteresis of Room air temperature of Frost protection'),
+    (52, 'Water Temperature Of Frost Protection', 'temp', 10.0, 60.0, 0.5,
+     'Water temperature of Frost protection'),
+    (53, 'Delay Time Off Main Water Pump From Off', 'seconds', 0.0, 120.0, 1.0,
+     'Delay time OFF Main water pump from OFF Frost protection operation function'),
+    (54, 'Start Temperature Of Frost Protection On Outdoor Air Temp', 'temp', 0.0, 10.0, 0.5,
+     'Start temperature of Frost protection on Outdoor air temperature'),
+    (55, 'Hysteresis Of Outdoor Air Temperature', 'temp', 0.5, 5.0, 0.5,
+     'Hysteresis of Outdoor air temperature'),
+    (56, 'Backup Heater Set Point During Frost Protection', 'temp', 0.0, 10.0, 0.5,
+     'Backup heater set point during Frost protection'),
+    (57, 'Hysteresis Of Outgoing Water Temperature', 'temp', 0.5, 5.0, 0.5,
+     'Hysteresis of Outgoing water temperature'),
+    (58, 'Start Temperature Of Frost Protection On DHW Tank Temp', 'temp', 0.0, 60.0, 0.5,
+     'Start temperature of Frost protection on DHW tank temperature'),
+    (59, 'Hysteresis Of DHW Tank Temperature', 'temp', 0.5, 5.0, 0.5,
+     'Hysteresis of DHW tank temperature'),
+    (60, 'Room Relative Humidity Value', 'percent', 0.0, 100.0, 1.0,
+     'Room relative humidity value'),
+    (61, 'Room Relative Humidity Value To Start Increasing Flow Temp', 'percent', 0.0, 100.0, 1.0,
+     'Room relative humidity value to start increasing Outgoing water temperature set'),
+    (62, 'Max Flow Temp Hysteresis relative to Humidity', 'temp', 0.5, 20.0, 0.5,
+     'Max. Outgoing temperature hysteresis corresponding to 100% relative humidity'),
+    (63, 'Mixing Valve Runtime', 'seconds', 0.0, 900.0, 10.0,
+     'Mixing valve runtime (from the fully closed to the fully open position)'),
+    (64, 'Mixing Valve Integral Factor', 'plain', None, None, None,
+     'Mixing valve integral factor'),
+    (65, 'Max Water Temperature In Mixing Circuit', 'temp', None, None, None,
+     'Max Water temperature in mixing circuit'),
+    (66, '3way Valve Change Over Time', 'seconds', 1.0, 900.0, 1.0,
+     '3way valve change over time'),
+    (67, 'Flow Switch Alarm Delay Time At. Pump Start Up', 'seconds', None, None, None,
+     'Flow switch alarm delay time at. Pump start up'),
+    (68, 'Flow Switch Alarm Delay Time', 'seconds', None, None, None,
+     'Flow switch alarm delay time in steady operation of the water pump'),
+    (69, 'The Number Of Retry Until Displaying Alarm', 'plain', None, None, None,
+     'The number of retry until displaying alarm'),
+    (70, 'The Time Of Repeating Retry Until Displaying Alarm', 'seconds', None, None, None,
+     'The time of repeating retry until displaying alarm'),
+    (71, 'Backup Heater Type Of Function', 'plain', 0.0, 3.0, None,
+     'Backup heater type of function (0=disable, 1=Replacement mode, 2=Emergency mode, 3=Supplementary mode)'),
+    (72, 'Manual Water Set Point', 'temp', 40.0, 60.0, 0.5,
+     'Manual water set point'),
+    (73, 'Manual Water Temperature Hysteresis', 'temp', 0.5, 10.0, 0.5,
+     'Manual water temperature hysteresis'),
+    (74, 'Delay Time Of The Heater Off That Avoid Flow Switch Alarm', 'seconds', None, None, 1.0,
+     'Delay time of the heater OFF that avoid flow switch alarm'),
+    (75, 'Heater Activation Delay Time', 'minutes', 0.0, 900.0, 1.0,
+     'Heater activation delay time'),
+    (76, 'Integration Time For Starting Heaters', 'seconds', 0.0, 900.0, 1.0,
+     'Integration time for starting heaters'),
+    (77, 'Outdoor Air Temperature To Enable Backup Heater', 'temp', -20.0, 20.0, 0.5,
+     'Outdoor air temperature to enable Backup heaters and disable compressor'),
+    (78, 'Outdoor Air Temperature Hysteresis To Disable Backup Heaters and Enable Compressor', 'temp', 0.5, 10.0, 0.5,
+     'Outdoor air temperature hysteresis to disable Backup heaters and enable compressor'),
+    (79, 'Outdoor Air Temperature To Enable Backup Heaters', 'temp', -20.0, 20.0, 0.5,
+     'Outdoor air temperature to enable Backup heaters (Supplementary mode)'),
+    (80, 'Outdoor Air Temperature Hysteresis To Disable Backup Heaters (Supplementary Mode)', 'temp', 0.5, 10.0, 0.5,
+     'Outdoor air temperature hysteresis to disable Backup heaters (Supplementary mode)'),
+    (81, 'Freeze Protection Functions', 'plain', 0.0, 3.0, None,
+     'Freeze protection functions (0=disable, 1=enabled during Start-up, 2=enabled during Defrost, 3=enabled during Start-up and Defrost)'),
+    (82, 'Outgoing Water Temperature Set Point During Start-up', 'temp', 0.0, 60.0, 0.5,
+     'Outgoing water temperature set point during Start-up'),
+    (83, 'Hysteresis Water Temperature Set Point During Start-up', 'temp', 0.5, 10.0, 0.5,
+     'Hysteresis water temperature set point during Start-up'),
+    (84, 'EHS Type Of Function', 'plain', 0.0, 2.0, None,
+     'EHS type of function (0=disable, 1=Replacement mode, 2=Supplementary mode)'),
+    (85, 'Outdoor Air Temperature To Enable EHS And Disable Compressor', 'temp', -20.0, 20.0, 0.5,
+     'Outdoor air temperature to enable EHS and disable compressor'),
+    (86, 'Outdoor Air Temperature Hysteresis To Disable Enable Compressor', 'temp', 0.5, 10.0, 0.5,
+     'Outdoor air temperature hysteresis to disable EHS and enable compressor'),
+    (87, 'Outdoor Air Temperature To Enable EHS', 'temp', -20.0, 20.0, 0.5,
+     'Outdoor air temperature to enable EHS (Supplementary mode)'),
+    (88, 'Outdoor Air Temperature Hysteresis To Disable EHS', 'temp', 0.5, 10.0, 0.5,
+     'Outdoor air temperature hysteresis to disable EHS (Supplementary mode)'),
+    (89, 'EHS Activation Delay Time', 'minutes', 0.0, 900.0, 1.0,
+     'EHS activation delay time'),
+    (90, 'Integration Time For Starting EHS', 'seconds', 0.0, 900.0, 1.0,
+     'Integration time for starting EHS'),
+    (91, 'Terminal 20-21 : On/off Remote Contact Or EHS Alarm', 'plain', 0.0, 2.0, None,
+     'Terminal 20-21 : ON/OFF remote contact or EHS Alarm input (0=disable (Remote controller only), 1=ON/OFF remote contact, 2=EHS Alarm input)'),
+    (92, 'Terminal 24-25 : Heating/cooling Mode Remote Contact', 'plain', 0.0, 2.0, None,
+     'Terminal 24-25 : Heating/Cooling mode remote contact (0=disable (Remote controller only), 1=Cooling is CLOSE contact Heating is OPEN contact, 2=Cooling is OPEN contact Heating is CLOSE contact)'),
+    (93, 'Terminal 47 : Alarm', 'plain', 0.0, 2.0, None,
+     'Terminal 47 : Alarm (Configurable output) (0=disable, 1=Alarm, 2=Ambient temperature reached)'),
+    (94, 'Terminal 48 : Pump1', 'plain', 0.0, 1.0, None,
+     'Terminal 48 : Pump1 (0=disable, 1=1st Additional water pump1 for Zone1)'),
+    (95, 'Terminal 49 : Pump2', 'plain', 0.0, 1.0, None,
+     'Terminal 49 : Pump2 (0=disable, 1=2nd Additional water pump2 for Zone2)'),
+    (96, 'Terminal 50-51-52 : DHW 3way Valve', 'plain', 1.0, 1.0, None,
+     'Terminal 50-51-52 : DHW 3way valve (1=enable)'),
+    (99, 'Buffer Tank Set Point For Heating', 'temp', 23.0, 60.0, 0.5,
+     'Buffer tank set point for Heating'),
+    (100, 'Buffer Tank Set Point For Cooling', 'temp', 7.0, 23.0, 0.5,
+     'Buffer tank set point for Cooling'),
+)
+
+
+def _holding_entry(name, kind, min_value, max_value, step, description):
+    """Expand one _HOLDING_SPEC row into the full entry dict."""
+    unit, device_class, scale = _HOLDING_KINDS[kind]
+    entry = {
+        "name": name,
+        "unit": unit,
+        "device_class": device_class,
+        "scale": scale,
+        "offset": 0,
+        "writable": True,
+    }
+    if min_value is not None:
+        entry["min"] = min_value
+    if max_value is not None:
+        entry["max"] = max_value
+    if step is not None:
+        entry["step"] = step
+    entry["description"] = description
+    return entry
+
+
 HOLDING_REGISTER_MAP = {
+    addr: _holding_entry(name, kind, min_value, max_value, step, description)
+    for addr, name, kind, min_value, max_value, step, description in _HOLDING_SPEC
+}
+
+# Flat register-id -> scale lookup so hot paths don't walk the nested map
+HOLDING_SCALES = {
+    reg_id: info.get("scale", 1) for reg_id, info in HOLDING_REGISTER_MAP.items()
+}
+
+# Coil Registers (Read/Write boolean controls)
+COIL_REGISTER_MAP = {
+    1: {
+        "name": "Operation At The Time Of Reboot After Blackout 0",
+        "device_class": None,
+        "description": "Operation at the time of reboot after blackout 0 = disable 1 = enable"
+    },
     2: {
-        "name": "Fixed Flow Temp Zone 1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Heating Zone1, Fixed Outgoing water set point in Heating"
+        "name": "Heating Weather Compensation Zone 1",
+        "device_class": None,
+        "description": "Heating Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
     },
     3: {
-        "name": "Max Flow Temp Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Max. Outgoing water temperature in Heating mode (Tm1) Zone1"
+        "name": "Heating Weather Compensation Zone 2",
+        "device_class": None,
+        "description": "Heating Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
     },
     4: {
-        "name": "Min Flow Temp Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Min. Outgoing water temperature in Heating mode (Tm2) Zone1"
+        "name": "Cooling Weather Compensation Zone 1",
+        "device_class": None,
+        "description": "Cooling Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
     },
     5: {
-        "name": "Min Outdoor Air Temperature Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone1"
+        "name": "Cooling Weather Compensation Zone 2",
+        "device_class": None,
+        "description": "Cooling Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic Curve)"
     },
     6: {
-        "name": "Max Outdoor Air Temperature Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 40.0,
-        "step": 0.5,
-        "description": "Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone1"
+        "name": "Anti-legionella Function",
+        "device_class": None,
+        "description": "Anti-legionella function (0=disable, 1=enable)"
     },
     7: {
-        "name": "Fixed Flow Temp Zone 2",
-        "unit": UnitOfTemperature.CELSIUS,
+        "name": "The HP Unit Turns On/off Based On",
         "device_class": None,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Heating Zone2, Fixed Outgoing water set point in Heating"
+        "description": "The HP unit turns ON/OFF based on (0=Room set point, 1=Water set point)"
     },
     8: {
-        "name": "Max Flow Temp Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Max. Outgoing water temperature in Heating mode (Tm1) Zone2"
+        "name": "Frost Protection Based On Room Temperature",
+        "device_class": None,
+        "description": "Frost Protection based on Room Temperature"
     },
     9: {
-        "name": "Min Flow Temp Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Min. Outgoing water temperature in Heating mode (Tm2) Zone2"
+        "name": "Frost Protection Based On Outdoor Temperature",
+        "device_class": None,
+        "description": "Frost protection by outdoor temperature 0=disable 1 = enable"
     },
     10: {
-        "name": "Min Outdoor Air Temperature Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone2"
+        "name": "Frost Protection Based On Flow Temp",
+        "device_class": None,
+        "description": "Frost protection based on Outgoing water temperature 0=disable 1 = enable"
     },
     11: {
-        "name": "Max Outdoor Air Temperature Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 40.0,
-        "step": 0.5,
-        "description": "Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone2"
+        "name": "DHW Storage Frost Protection",
+        "device_class": None,
+        "description": "DHW storage frost protection 0=disable 1 = enable"
     },
     12: {
-        "name": "Cooling Fixed Flow Temp Zone 1",
-        "unit": UnitOfTemperature.CELSIUS,
+        "name": "Secondary System Circuit Frost Protection",
         "device_class": None,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Cooling Zone1, Fixed Outgoing water set point in Cooling"
+        "description": "Secondary system circuit frost protection 0=disable 1 = enable"
     },
     13: {
-        "name": "Max. Flow Temperature In Cooling Mode",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Max. Outgoing water temperature in Cooling mode (Tm1) Zone1"
+        "name": "Compensation For Room Humidity",
+        "device_class": None,
+        "description": "Compensation for room humidity (0=disable, 1=enable)"
     },
     14: {
-        "name": "Min. Flow Water Temperature In Cooling Mode",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Min. Outgoing water temperature in Cooling mode (Tm2) Zone1"
+        "name": "Conditions To Be Available Backup Heaters",
+        "device_class": None,
+        "description": "Conditions to be available Backup heaters (0=always enabled, 1=depends on Outdoor Air temperature)"
     },
     15: {
-        "name": "Min. Outdoor Air Temperature Cooling Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Min. Outdoor air temperature corresponding to min. Outgoing water temperature Cooling (Te1) Zone1"
+        "name": "Terminal 41-42 : EHS (External heat source for space heating)",
+        "device_class": None,
+        "description": "Terminal 41-42 : EHS (0=disable, 1=enable)"
     },
     16: {
-        "name": "Max. Outdoor Air Temperature Corresponding To max. Outgoing water temperature Cooling (Te2) Zone1",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Max. Outdoor air temperature corresponding to max. Outgoing water temperature Cooling (Te2) Zone1"
+        "name": "Terminal 1-2-3 : Remote Controller",
+        "device_class": None,
+        "description": "Terminal 1-2-3 : Remote Controller (0=disable, 1=enable)"
     },
     17: {
-        "name": "Cooling Fixed Flow Temp Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
+        "name": "Terminal 4-5-6 : 3way Mixing Valve",
         "device_class": None,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Cooling Zone2, Fixed Outgoing water set point in Cooling"
+        "description": "Terminal 4-5-6 : 3way mixing valve (0=disable, 1=enable)"
     },
     18: {
-        "name": "Max Flow Temperature In Cooling Mode 2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Max. Outgoing water temperature in Cooling mode (Tm1) Zone2"
+        "name": "Terminal 7-8 : DHW Tank Temperature Probe",
+        "device_class": None,
+        "description": "Terminal 7-8 : DHW tank temperature probe (0=disable, 1=enable)"
     },
     19: {
-        "name": "Min Flow Temperature In Cooling Mode 2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Min. Outgoing water temperature in Cooling mode (Tm2) Zone2"
+        "name": "Terminal 9-10 : Outdoor Air Temperature Probe",
+        "device_class": None,
+        "description": "Terminal 9-10 : Outdoor air temperature probe (additional) (0=disable, 1=enable)"
     },
     20: {
-        "name": "Min Outdoor Air Temperature Cooling Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Min. Outdoor air temperature corresponding to max. Outgoing water temperature (Te1) Zone2"
+        "name": "Terminal 11-12 : Buffer Tank Temperature Probe",
+        "device_class": None,
+        "description": "Terminal 11-12 : Buffer tank temperature probe (0=disable, 1=enable)"
     },
     21: {
-        "name": "Max. Outdoor Air Temperature Cooling Zone2",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "Max. Outdoor air temperature corresponding to max. Outgoing water temperature (Te2) Zone2"
+        "name": "Terminal 13-14 : Mix Water Temperature Probe",
+        "device_class": None,
+        "description": "Terminal 13-14 : Mix Water temperature probe (0=disable, 1=enable)"
     },
     22: {
-        "name": "Hysteresis Of Water Set Point In Heating And DHW",
-        "unit": UnitOfTemperature.CELSIUS,
+        "name": "Terminal 15-16-32 : Rs485 Mod Bus",
         "device_class": None,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Hysteresis of water set point in Heating and DHW"
+        "description": "Terminal 15-16-32 : RS485 Mod Bus (0=disable, 1=enable)"
     },
     23: {
-        "name": "Hysteresis Of Water Set Point In Cooling",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Hysteresis of water set point in Cooling"
+        "name": "Terminal 17-18 : Humidity Sensor",
+        "device_class": None,
+        "description": "Terminal 17-18 : Humidity sensor (0=disable, 1=enable)"
     },
     24: {
-        "name": "Low Tariff Deferential Water Set Point For Heating",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Low tariff deferential water set point for Heating"
+        "name": "Terminal 19-18 : DHW Remote Contact",
+        "device_class": None,
+        "description": "Terminal 19-18 : DHW remote contact (0=disable (Remote controller only), 1=enable)"
     },
     25: {
-        "name": "Low Tariff Deferential Water Set Point For Cooling",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Low tariff deferential water set point for Cooling"
+        "name": "Terminal 22-23 : Dual Set Point Control",
+        "device_class": None,
+        "description": "Terminal 22-23 : Dual set point control (0=disable, 1=enable)"
     },
     26: {
-        "name": "DHW Production Priority Setting",
-        "unit": None,
+        "name": "Terminal 26-27 : Flow Switch",
         "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "DHW production priority setting (0=DHW is unavailable, 1=DHW is available and priority DHW over space Heating, 2=DHW is available and priority space Heating over DHW)"
+        "description": "Terminal 26-27 : Flow switch (0=disable, 1=enable)"
     },
     27: {
-        "name": "Type Of Configuration To Heat The DHW",
-        "unit": None,
+        "name": "Terminal 28-29 : Night Mode",
         "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "Type of configuration to heat the DHW (0=Heat pump + Heater, 1=Heat pump only, 2=Heater only)"
+        "description": "Terminal 28-29 : Night mode (0=disable (Remote controller only), 1=enable)"
     },
     28: {
-        "name": "DHW Comfort Set Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 40.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "DHW Comfort set temperature"
+        "name": "Terminal 30-31 : Low Tariff",
+        "device_class": None,
+        "description": "Terminal 30-31 : Low tariff (0=disable (Remote controller only), 1=enable)"
     },
     29: {
-        "name": "DHW Economy Set Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 30.0,
-        "max": 50.0,
-        "step": 0.5,
-        "description": "DHW Economy set temperature"
+        "name": "Terminal 41-42 : EHS",
+        "device_class": None,
+        "description": "Terminal 41-42 : EHS (External heat source for space heating) (0=disable, 1=enable)"
     },
     30: {
-        "name": "DHW Set Point Hysteresis",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "DHW set point hysteresis"
+        "name": "Terminal 43-44 : Heating/cooling Mode Output",
+        "device_class": None,
+        "description": "Terminal 43-44 : Heating/Cooling mode output (0=disable, 1=Indication of Cooling mode (CLOSE=Cooling), 2=indication of Heating mode (CLOSE=Heating))"
     },
     31: {
-        "name": "DHW Over Boost Mode Set Point",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 50.0,
-        "max": 90.0,
-        "step": 0.5,
-        "description": "DHW Over boost mode set point"
+        "name": "Terminal 45 : Dehumidifier",
+        "device_class": None,
+        "description": "Terminal 45 : Dehumidifier (0=disable, 1=enable)"
     },
     32: {
-        "name": "Max. Time For DHW Request",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Max. time for DHW request"
-    },
-    33: {
-        "name": "Delay Time On DHW Heater From Off Compressor",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "step": 1.0,
-        "description": "Delay time on DHW heater from OFF compressor"
-    },
-    34: {
-        "name": "Outdoor Air Temperature To Enable DHW Heaters",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature to enable DHW heaters"
-    },
-    35: {
-        "name": "Outdoor Air Temperature Hysteresis To Disable DHW Heaters",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature hysteresis to disable DHW heaters"
-    },
-    36: {
-        "name": "Anti-legionella Set Point",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "step": 0.5,
-        "description": "Anti-legionella set point"
-    },
-    37: {
-        "name": "Max. Frequency Of Night Mode",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": SensorDeviceClass.FREQUENCY,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 20.0,
-        "max": 100.0,
-        "step": 5.0,
-        "description": "Max. frequency of Night mode"
-    },
-    38: {
-        "name": "Min. Time Compressor On/off Time",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 0.0,
-        "step": 1.0,
-        "description": "Min. time compressor ON/OFF time"
-    },
-    39: {
-        "name": "Delay Time Pump Off From Compressor Off",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Delay time pump OFF from compressor OFF"
-    },
-    40: {
-        "name": "Delay Time Compressor On From Pump On",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Delay time compressor ON from pump ON"
-    },
-    41: {
-        "name": "Type Of Configuration Of Main Water Pump",
-        "unit": None,
+        "name": "Terminal 46 : DHW Electric Heater Or Backup Heater",
         "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "Type of configuration of Main water pump (0=always ON, 1=ON/OFF based on Buffertank temperature, 2=ON/OFF based on Sniffing cycles"
-    },
-    42: {
-        "name": "Time On Main Water Pump For Sniffing Cycle",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 1.0,
-        "max": 15.0,
-        "step": 1.0,
-        "description": "Time ON Main water pump for Sniffing cycle"
-    },
-    43: {
-        "name": "Time Off Main Water Pump",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 5.0,
-        "max": 30.0,
-        "step": 1.0,
-        "description": "Time OFF Main water pump"
-    },
-    44: {
-        "name": "Delay Time Off Main Water Pump From Off Compressor",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 1.0,
-        "max": 15.0,
-        "step": 1.0,
-        "description": "Delay time OFF Main water pump from OFF compressor"
-    },
-    45: {
-        "name": "Off Time For Unlock Pump Function Start",
-        "unit": "h",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 240.0,
-        "step": 1.0,
-        "description": "OFF time for Unlock pump function start"
-    },
-    46: {
-        "name": "Time On Main Water Pump For Unlock Pump Function",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 10.0,
-        "step": 1.0,
-        "description": "Time ON Main water pump for Unlock pump function"
-    },
-    47: {
-        "name": "Time On Water Pump1 For Unlock Pump Function",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 10.0,
-        "step": 1.0,
-        "description": "Time ON water pump1 for Unlock pump function"
-    },
-    48: {
-        "name": "Time On Water Pump2 For Unlock Pump Function",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 10.0,
-        "step": 1.0,
-        "description": "Time ON water pump2 for Unlock pump function"
-    },
-    49: {
-        "name": "Type Of Operation Of Additional Water Pump",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 4.0,
-        "description": "Type of operation of additional water pump (0=disable, 1=depending on Main water pump setting, 2=depending on Main water pump setting but always OFF when the DHW mode is activated, 3=always ON apart if any alarms are activated or if the HP unit is in OFF mode, 4=ON/OFF based on Room air temperature)"
-    },
-    50: {
-        "name": "Start Temperature Of Frost Protection On Room Air Temp",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 40.0,
-        "step": 0.5,
-        "description": "Start temperature of Frost protection on Room air temperature"
-    },
-    51: {
-        "name": "Hysteresis Of Room Air Temperature Of Frost Protection",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 5.0,
-        "step": 0.5,
-        "description": "Hysteresis of Room air temperature of Frost protection"
-    },
-    52: {
-        "name": "Water Temperature Of Frost Protection",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 10.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Water temperature of Frost protection"
-    },
-    53: {
-        "name": "Delay Time Off Main Water Pump From Off",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 120.0,
-        "step": 1.0,
-        "description": "Delay time OFF Main water pump from OFF Frost protection operation function"
-    },
-    54: {
-        "name": "Start Temperature Of Frost Protection On Outdoor Air Temp",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Start temperature of Frost protection on Outdoor air temperature"
-    },
-    55: {
-        "name": "Hysteresis Of Outdoor Air Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 5.0,
-        "step": 0.5,
-        "description": "Hysteresis of Outdoor air temperature"
-    },
-    56: {
-        "name": "Backup Heater Set Point During Frost Protection",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Backup heater set point during Frost protection"
-    },
-    57: {
-        "name": "Hysteresis Of Outgoing Water Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 5.0,
-        "step": 0.5,
-        "description": "Hysteresis of Outgoing water temperature"
-    },
-    58: {
-        "name": "Start Temperature Of Frost Protection On DHW Tank Temp",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Start temperature of Frost protection on DHW tank temperature"
-    },
-    59: {
-        "name": "Hysteresis Of DHW Tank Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 5.0,
-        "step": 0.5,
-        "description": "Hysteresis of DHW tank temperature"
-    },
-    60: {
-        "name": "Room Relative Humidity Value",
-        "unit": PERCENTAGE,
-        "device_class": SensorDeviceClass.HUMIDITY,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 100.0,
-        "step": 1.0,
-        "description": "Room relative humidity value"
-    },
-    61: {
-        "name": "Room Relative Humidity Value To Start Increasing Flow Temp",
-        "unit": PERCENTAGE,
-        "device_class": SensorDeviceClass.HUMIDITY,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 100.0,
-        "step": 1.0,
-        "description": "Room relative humidity value to start increasing Outgoing water temperature set"
-    },
-    62: {
-        "name": "Max Flow Temp Hysteresis relative to Humidity",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Max. Outgoing temperature hysteresis corresponding to 100% relative humidity"
-    },
-    63: {
-        "name": "Mixing Valve Runtime",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 10.0,
-        "description": "Mixing valve runtime (from the fully closed to the fully open position)"
-    },
-    64: {
-        "name": "Mixing Valve Integral Factor",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "description": "Mixing valve integral factor"
-    },
-    65: {
-        "name": "Max Water Temperature In Mixing Circuit",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "description": "Max Water temperature in mixing circuit"
-    },
-    66: {
-        "name": "3way Valve Change Over Time",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 1.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "3way valve change over time"
-    },
-    67: {
-        "name": "Flow Switch Alarm Delay Time At. Pump Start Up",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "description": "Flow switch alarm delay time at. Pump start up"
-    },
-    68: {
-        "name": "Flow Switch Alarm Delay Time",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "description": "Flow switch alarm delay time in steady operation of the water pump"
-    },
-    69: {
-        "name": "The Number Of Retry Until Displaying Alarm",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "description": "The number of retry until displaying alarm"
-    },
-    70: {
-        "name": "The Time Of Repeating Retry Until Displaying Alarm",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "description": "The time of repeating retry until displaying alarm"
-    },
-    71: {
-        "name": "Backup Heater Type Of Function",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 3.0,
-        "description": "Backup heater type of function (0=disable, 1=Replacement mode, 2=Emergency mode, 3=Supplementary mode)"
-    },
-    72: {
-        "name": "Manual Water Set Point",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 40.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Manual water set point"
-    },
-    73: {
-        "name": "Manual Water Temperature Hysteresis",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Manual water temperature hysteresis"
-    },
-    74: {
-        "name": "Delay Time Of The Heater Off That Avoid Flow Switch Alarm",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "step": 1.0,
-        "description": "Delay time of the heater OFF that avoid flow switch alarm"
-    },
-    75: {
-        "name": "Heater Activation Delay Time",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Heater activation delay time"
-    },
-    76: {
-        "name": "Integration Time For Starting Heaters",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Integration time for starting heaters"
-    },
-    77: {
-        "name": "Outdoor Air Temperature To Enable Backup Heater",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature to enable Backup heaters and disable compressor"
-    },
-    78: {
-        "name": "Outdoor Air Temperature Hysteresis To Disable Backup Heaters and Enable Compressor",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature hysteresis to disable Backup heaters and enable compressor"
-    },
-    79: {
-        "name": "Outdoor Air Temperature To Enable Backup Heaters",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature to enable Backup heaters (Supplementary mode)"
-    },
-    80: {
-        "name": "Outdoor Air Temperature Hysteresis To Disable Backup Heaters (Supplementary Mode)",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature hysteresis to disable Backup heaters (Supplementary mode)"
-    },
-    81: {
-        "name": "Freeze Protection Functions",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 3.0,
-        "description": "Freeze protection functions (0=disable, 1=enabled during Start-up, 2=enabled during Defrost, 3=enabled during Start-up and Defrost)"
-    },
-    82: {
-        "name": "Outgoing Water Temperature Set Point During Start-up",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Outgoing water temperature set point during Start-up"
-    },
-    83: {
-        "name": "Hysteresis Water Temperature Set Point During Start-up",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Hysteresis water temperature set point during Start-up"
-    },
-    84: {
-        "name": "EHS Type Of Function",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "EHS type of function (0=disable, 1=Replacement mode, 2=Supplementary mode)"
-    },
-    85: {
-        "name": "Outdoor Air Temperature To Enable EHS And Disable Compressor",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature to enable EHS and disable compressor"
-    },
-    86: {
-        "name": "Outdoor Air Temperature Hysteresis To Disable Enable Compressor",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature hysteresis to disable EHS and enable compressor"
-    },
-    87: {
-        "name": "Outdoor Air Temperature To Enable EHS",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": -20.0,
-        "max": 20.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature to enable EHS (Supplementary mode)"
-    },
-    88: {
-        "name": "Outdoor Air Temperature Hysteresis To Disable EHS",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.5,
-        "max": 10.0,
-        "step": 0.5,
-        "description": "Outdoor air temperature hysteresis to disable EHS (Supplementary mode)"
-    },
-    89: {
-        "name": "EHS Activation Delay Time",
-        "unit": "min",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "EHS activation delay time"
-    },
-    90: {
-        "name": "Integration Time For Starting EHS",
-        "unit": "s",
-        "device_class": SensorDeviceClass.DURATION,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 900.0,
-        "step": 1.0,
-        "description": "Integration time for starting EHS"
-    },
-    91: {
-        "name": "Terminal 20-21 : On/off Remote Contact Or EHS Alarm",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "Terminal 20-21 : ON/OFF remote contact or EHS Alarm input (0=disable (Remote controller only), 1=ON/OFF remote contact, 2=EHS Alarm input)"
-    },
-    92: {
-        "name": "Terminal 24-25 : Heating/cooling Mode Remote Contact",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "Terminal 24-25 : Heating/Cooling mode remote contact (0=disable (Remote controller only), 1=Cooling is CLOSE contact Heating is OPEN contact, 2=Cooling is OPEN contact Heating is CLOSE contact)"
-    },
-    93: {
-        "name": "Terminal 47 : Alarm",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 2.0,
-        "description": "Terminal 47 : Alarm (Configurable output) (0=disable, 1=Alarm, 2=Ambient temperature reached)"
-    },
-    94: {
-        "name": "Terminal 48 : Pump1",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 1.0,
-        "description": "Terminal 48 : Pump1 (0=disable, 1=1st Additional water pump1 for Zone1)"
-    },
-    95: {
-        "name": "Terminal 49 : Pump2",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 0.0,
-        "max": 1.0,
-        "description": "Terminal 49 : Pump2 (0=disable, 1=2nd Additional water pump2 for Zone2)"
-    },
-    96: {
-        "name": "Terminal 50-51-52 : DHW 3way Valve",
-        "unit": None,
-        "device_class": None,
-        "scale": 1,
-        "offset": 0,
-        "writable": True,
-        "min": 1.0,
-        "max": 1.0,
-        "description": "Terminal 50-51-52 : DHW 3way valve (1=enable)"
-    },
-    99: {
-        "name": "Buffer Tank Set Point For Heating",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 23.0,
-        "max": 60.0,
-        "step": 0.5,
-        "description": "Buffer tank set point for Heating"
-    },
-    100: {
-        "name": "Buffer Tank Set Point For Cooling",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "scale": 0.1,
-        "offset": 0,
-        "writable": True,
-        "min": 7.0,
-        "max": 23.0,
-        "step": 0.5,
-        "description": "Buffer tank set point for Cooling"
+        "description": "Terminal 46 : DHW Electric heater or Backup heater (0=DHW Electric heater, 1=Backup heater)"
     },
 }
 
-# Coil Registers (Read/Write boolean controls)
-COIL_REGISTER_MAP = {
-    1: {
-        "name": "Operation At The Time Of Reboot After Blackout 0",
-        "device_class": None,
-        "description": "Operation at the time of reboot after blackout 0 = disable 1 = enable"
-    },
-    2: {
-        "name": "Heating Weather Compensation Zone 1",
-        "device_class": None,
-        "description": "Heating Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
-    },
-    3: {
-        "name": "Heating Weather Compensation Zone 2",
-        "device_class": None,
-        "description": "Heating Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
-    },
-    4: {
-        "name": "Cooling Weather Compensation Zone 1",
-        "device_class": None,
-        "description": "Cooling Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
-    },
-    5: {
-        "name": "Cooling Weather Compensation Zone 2",
-        "device_class": None,
-        "description": "Cooling Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic Curve)"
-    },
-    6: {
-        "name": "Anti-legionella Function",
-        "device_class": None,
-        "description": "Anti-legionella function (0=disable, 1=enable)"
-    },
-    7: {
-        "name": "The HP Unit Turns On/off Based On",
-        "device_class": None,
-        "description": "The HP unit turns ON/OFF based on (0=Room set point, 1=Water set point)"
-    },
-    8: {
-        "name": "Frost Protection Based On Room Temperature",
-        "device_class": None,
-        "description": "Frost Protection based on Room Temperature"
-    },
-    9: {
-        "name": "Frost Protection Based On Outdoor Temperature",
-        "device_class": None,
-        "description": "Frost protection by outdoor temperature 0=disable 1 = enable"
-    },
-    10: {
-        "name": "Frost Protection Based On Flow Temp",
-        "device_class": None,
-        "description": "Frost protection based on Outgoing water temperature 0=disable 1 = enable"
-    },
-    11: {
-        "name": "DHW Storage Frost Protection",
-        "device_class": None,
-        "description": "DHW storage frost protection 0=disable 1 = enable"
-    },
-    12: {
-        "name": "Secondary System Circuit Frost Protection",
-        "device_class": None,
-        "description": "Secondary system circuit frost protection 0=disable 1 = enable"
-    },
-    13: {
-        "name": "Compensation For Room Humidity",
-        "device_class": None,
-        "description": "Compensation for room humidity (0=disable, 1=enable)"
-    },
-    14: {
-        "name": "Conditions To Be Available Backup Heaters",
-        "device_class": None,
-        "description": "Conditions to be available Backup heaters (0=always enabled, 1=depends on Outdoor Air temperature)"
-    },
-    15: {
-        "name": "Terminal 41-42 : EHS (External heat source for space heating)",
-        "device_class": None,
-        "description": "Terminal 41-42 : EHS (0=disable, 1=enable)"
-    },
-    16: {
-        "name": "Terminal 1-2-3 : Remote Controller",
-        "device_class": None,
-        "description": "Terminal 1-2-3 : Remote Controller (0=disable, 1=enable)"
-    },
-    17: {
-        "name": "Terminal 4-5-6 : 3way Mixing Valve",
-        "device_class": None,
-        "description": "Terminal 4-5-6 : 3way mixing valve (0=disable, 1=enable)"
-    },
-    18: {
-        "name": "Terminal 7-8 : DHW Tank Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 7-8 : DHW tank temperature probe (0=disable, 1=enable)"
-    },
-    19: {
-        "name": "Terminal 9-10 : Outdoor Air Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 9-10 : Outdoor air temperature probe (additional) (0=disable, 1=enable)"
-    },
-    20: {
-        "name": "Terminal 11-12 : Buffer Tank Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 11-12 : Buffer tank temperature probe (0=disable, 1=enable)"
-    },
-    21: {
-        "name": "Terminal 13-14 : Mix Water Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 13-14 : Mix Water temperature probe (0=disable, 1=enable)"
-    },
-    22: {
-        "name": "Terminal 15-16-32 : Rs485 Mod Bus",
-        "device_class": None,
-        "description": "Terminal 15-16-32 : RS485 Mod Bus (0=disable, 1=enable)"
-    },
-    23: {
-        "name": "Terminal 17-18 : Humidity Sensor",
-        "device_class": None,
-        "description": "Terminal 17-18 : Humidity sensor (0=disable, 1=enable)"
-    },
-    24: {
-        "name": "Terminal 19-18 : DHW Remote Contact",
-        "device_class": None,
-        "description": "Terminal 19-18 : DHW remote contact (0=disable (Remote controller only), 1=enable)"
-    },
-    25: {
-        "name": "Terminal 22-23 : Dual Set Point Control",
-        "device_class": None,
-        "description": "Terminal 22-23 : Dual set point control (0=disable, 1=enable)"
-    },
-    26: {
-        "name": "Terminal 26-27 : Flow Switch",
-        "device_class": None,
-        "description": "Terminal 26-27 : Flow switch (0=disable, 1=enable)"
-    },
-    27: {
-        "name": "Terminal 28-29 : Night Mode",
-        "device_class": None,
-        "description": "Terminal 28-29 : Night mode (0=disable (Remote controller only), 1=enable)"
-    },
-    28: {
-        "name": "Terminal 30-31 : Low Tariff",
-        "device_class": None,
-        "description": "Terminal 30-31 : Low tariff (0=disable (Remote controller only), 1=enable)"
-    },
-    29: {
-        "name": "Terminal 41-42 : EHS",
-        "device_class": None,
-        "description": "Terminal 41-42 : EHS (External heat source for space heating) (0=disable, 1=enable)"
-    },
-    30: {
-        "name": "Terminal 43-44 : Heating/cooling Mode Output",
-        "device_class": None,
-        "description": "Terminal 43-44 : Heating/Cooling mode output (0=disable, 1=Indication of Cooling mode (CLOSE=Cooling), 2=indication of Heating mode (CLOSE=Heating))"
-    },
-    31: {
-        "name": "Terminal 45 : Dehumidifier",
-        "device_class": None,
-        "description": "Terminal 45 : Dehumidifier (0=disable, 1=enable)"
-    },
-    32: {
-        "name": "Terminal 46 : DHW Electric Heater Or Backup Heater",
-        "device_class": None,
-        "description": "Terminal 46 : DHW Electric heater or Backup heater (0=DHW Electric heater, 1=Backup heater)"
-    },
+
+def _intern_strings(register_map):
+    """Intern the name/unit/description strings of every map entry.
+
+    Repeated literals like "rpm" or the shared description prefixes then
+    collapse to one heap object each, and downstream == comparisons hit
+    the pointer-equality fast path. Enum-valued units are left alone.
+    """
+    for info in register_map.values():
+        for key in ("name", "unit", "description"):
+            value = info.get(key)
+            if type(value) is str:
+                info[key] = sys.intern(value)
+
+
+for _register_map in (INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP, COIL_REGISTER_MAP):
+    _intern_strings(_register_map)
+
+
+def _compute_blocks(register_map, max_gap=1, max_len=60):
+    """Group a sparse register map into contiguous (start, count) blocks.
+
+    Walks the sorted addresses and starts a new block whenever the next
+    address is more than max_gap past the previous one or the block would
+    exceed max_len registers (well under the Modbus PDU limit of 125; 60
+    keeps individual transactions short on the Aerona3). The coordinator
+    reads one block per Modbus transaction instead of one read per address.
+    """
+    addresses = sorted(register_map)
+    blocks = []
+    start = prev = addresses[0]
+    for addr in addresses[1:]:
+        if addr - prev > max_gap or addr - start + 1 > max_len:
+            blocks.append((start, prev - start + 1))
+            start = addr
+        prev = addr
+    blocks.append((start, prev - start + 1))
+    return tuple(blocks)
+
+
+def _compute_offsets(blocks):
+    """Map each address covered by blocks to (block_index, offset_in_block)."""
+    return {
+        start + offset: (block_idx, offset)
+        for block_idx, (start, count) in enumerate(blocks)
+        for offset in range(count)
+    }
+
+
+# Contiguous read plans derived from the register maps at import time
+INPUT_REGISTER_BLOCKS = _compute_blocks(INPUT_REGISTER_MAP)
+HOLDING_REGISTER_BLOCKS = _compute_blocks(HOLDING_REGISTER_MAP)
+COIL_READ_BATCHES = _compute_blocks(COIL_REGISTER_MAP)
+INPUT_REGISTER_OFFSETS = _compute_offsets(INPUT_REGISTER_BLOCKS)
+HOLDING_REGISTER_OFFSETS = _compute_offsets(HOLDING_REGISTER_BLOCKS)
+
+
+def _block_scales(blocks, scales):
+    """Scale factors laid out block-by-block, aligned with each read plan.
+
+    Lets a whole Modbus response be scaled in one zip pass over the block's
+    scale tuple instead of a nested-map lookup per register. Addresses in a
+    block that have no map entry (gap filler) get scale 1. All register
+    offsets on the Aerona3 are 0, so scaling is a plain multiply.
+    """
+    return tuple(
+        tuple(scales.get(start + i, 1) for i in range(count))
+        for start, count in blocks
+    )
+
+
+INPUT_BLOCK_SCALES = _block_scales(INPUT_REGISTER_BLOCKS, INPUT_SCALES)
+HOLDING_BLOCK_SCALES = _block_scales(HOLDING_REGISTER_BLOCKS, HOLDING_SCALES)
+
+# Polling tiers. Fast-moving operational values (compressor frequency,
+# power, pump speed, outdoor/flow temperatures, DHW tank) can be polled
+# more often than the configuration holdings, which only change when the
+# installer edits them. Tier membership lives in flat sets rather than a
+# per-entry key so the register maps stay untouched.
+POLL_TIERS = {"fast": 2, "normal": 10, "slow": 60}
+
+FAST_INPUT_REGISTERS = frozenset({1, 3, 4, 6, 9, 16})
+SLOW_HOLDING_REGISTERS = frozenset(
+    addr for addr in HOLDING_REGISTER_MAP if 22 <= addr <= 59
+)
+
+# Per-tier read plans. The fast tier allows wider gaps so the whole group
+# fits in as few transactions as possible - reading an unmapped register
+# inside the contiguous 0-19 span is cheaper than a second round trip.
+FAST_INPUT_BLOCKS = _compute_blocks(FAST_INPUT_REGISTERS, max_gap=3)
+NORMAL_INPUT_BLOCKS = _compute_blocks(
+    set(INPUT_REGISTER_MAP) - FAST_INPUT_REGISTERS
+)
+SLOW_HOLDING_BLOCKS = _compute_blocks(SLOW_HOLDING_REGISTERS)
+NORMAL_HOLDING_BLOCKS = _compute_blocks(
+    set(HOLDING_REGISTER_MAP) - SLOW_HOLDING_REGISTERS
+)
+
+# Integer reciprocals of the fractional scales (0.1 -> 10, 1 -> 1), so
+# decoding stays in int arithmetic (raw / inv is exact) and encoding a
+# setpoint is an integer multiply instead of a true division plus
+# truncation. Only scales in (0, 1] have an integer reciprocal; registers
+# scaled up (100 W power counts and the like) are deliberately absent, so
+# misuse fails loudly as a KeyError rather than dividing by a wrong
+# reciprocal.
+INPUT_INV_SCALES = {
+    reg_id: round(1 / scale)
+    for reg_id, scale in INPUT_SCALES.items()
+    if 0 < scale <= 1
+}
+HOLDING_INV_SCALES = {
+    reg_id: round(1 / scale)
+    for reg_id, scale in HOLDING_SCALES.items()
+    if 0 < scale <= 1
 }
+
+# Writable-holding bounds packed into one flat table so write validation
+# is a single lookup plus two compares instead of walking the nested map
+HOLDING_WRITE_BOUNDS = {
+    addr: (info.get("min"), info.get("max"))
+    for addr, info in HOLDING_REGISTER_MAP.items()
+    if info.get("writable")
+}
+
+
+def clamp_holding_value(addr, value):
+    """Clamp a scaled value into the register's configured min/max range.
+
+    Registers without bounds (or non-writable addresses) pass the value
+    through unchanged.
+    """
+    bounds = HOLDING_WRITE_BOUNDS.get(addr)
+    if bounds is None:
+        return value
+    low, high = bounds
+    if low is not None and value < low:
+        return low
+    if high is not None and value > high:
+        return high
+    return value
+
+
+def _mk_range_validator(low, high):
+    """Build a closure with the bounds baked in as default args.
+
+    Calling the validator is then two compares against locals - no dict
+    or attribute lookups on the write path.
+    """
+    def _valid(value, _low=low, _high=high):
+        return _low <= value <= _high
+    return _valid
+
+
+# min/max/step with the platform defaults (0, 100, 1) folded in once at
+# import, so consumers unpack one complete triple instead of branching on
+# three .get calls per access
+HOLDING_MIN_MAX_STEP = {
+    addr: (info.get("min", 0), info.get("max", 100), info.get("step", 1))
+    for addr, info in HOLDING_REGISTER_MAP.items()
+}
+
+# value -> bool validators, one per writable register with full bounds
+HOLDING_VALIDATORS = {
+    addr: _mk_range_validator(low, high)
+    for addr, (low, high) in HOLDING_WRITE_BOUNDS.items()
+    if low is not None and high is not None
+}
+
+
+# Reverse lookups, built once so service handlers can go from a display
+# string back to the numeric code (or a register name back to its
+# address) with a single hash instead of a generator scan
+OPERATING_MODES_INV = {name: code for code, name in enumerate(OPERATING_MODES)}
+ERROR_CODES_INV = {name: code for code, name in enumerate(ERROR_CODES)}
+HOLDING_NAME_TO_ADDR = {
+    info["name"]: addr for addr, info in HOLDING_REGISTER_MAP.items()
+}
+COIL_NAME_TO_ADDR = {
+    info["name"]: addr for addr, info in COIL_REGISTER_MAP.items()
+}
+
+
+def register_id_for(name):
+    """Resolve a register display name to its address.
+
+    Holdings take precedence over coils; raises KeyError for unknown
+    names, matching plain dict lookup semantics.
+    """
+    addr = HOLDING_NAME_TO_ADDR.get(name)
+    if addr is not None:
+        return addr
+    return COIL_NAME_TO_ADDR[name]
+
+# Frequently needed subsets, computed once instead of re-filtering the
+# full maps during platform setup and every coordinator poll
+WRITABLE_HOLDINGS = frozenset(
+    addr for addr, info in HOLDING_REGISTER_MAP.items() if info.get("writable")
+)
+TEMP_INPUT_ADDRS = frozenset(
+    addr for addr, info in INPUT_REGISTER_MAP.items()
+    if info.get("device_class") == SensorDeviceClass.TEMPERATURE
+)
+
+# Read plan restricted to the writable holdings - the only holdings the
+# coordinator polls
+WRITABLE_HOLDING_BLOCKS = _compute_blocks(WRITABLE_HOLDINGS)
+
+# Writable addresses packed into an int bitmap: (BITMAP >> addr) & 1 is a
+# branchless shift-and-mask with no hashing. All current writable
+# holdings are < 128; is_writable_holding falls back to the frozenset for
+# anything past the bitmap's range.
+WRITABLE_HOLDINGS_BITMAP = 0
+for _addr in WRITABLE_HOLDINGS:
+    if _addr < 128:
+        WRITABLE_HOLDINGS_BITMAP |= 1 << _addr
+
+
+def is_writable_holding(addr):
+    """Return True if addr is a user-writable holding register."""
+    if 0 <= addr < 128:
+        return bool((WRITABLE_HOLDINGS_BITMAP >> addr) & 1)
+    return addr in WRITABLE_HOLDINGS
+
+
+# Same trick for the coils: addresses 1-32 packed into one mask
+COIL_VALID_MASK = 0
+for _addr in COIL_REGISTER_MAP:
+    COIL_VALID_MASK |= 1 << _addr
+
+
+def coil_defined(addr):
+    """Return True if addr has an entry in COIL_REGISTER_MAP."""
+    return addr >= 0 and bool((COIL_VALID_MASK >> addr) & 1)
+
+
+# Hard-freeze the public mapping constants. A read-only view costs one
+# wrapper object each, guarantees no consumer mutates shared tables, and
+# lets the adaptive interpreter treat lookups against them as stable.
+_MP = MappingProxyType
+CLIMATE_MODES = _MP(CLIMATE_MODES)
+# The register maps are frozen entry by entry as well: consumers treat
+# the inner dicts as read-only specs, and the proxies make that a
+# guarantee instead of a convention.
+INPUT_REGISTER_MAP = _MP({a: _MP(v) for a, v in INPUT_REGISTER_MAP.items()})
+HOLDING_REGISTER_MAP = _MP({a: _MP(v) for a, v in HOLDING_REGISTER_MAP.items()})
+COIL_REGISTER_MAP = _MP({a: _MP(v) for a, v in COIL_REGISTER_MAP.items()})
+INPUT_SCALES = _MP(INPUT_SCALES)
+HOLDING_SCALES = _MP(HOLDING_SCALES)
+INPUT_INV_SCALES = _MP(INPUT_INV_SCALES)
+HOLDING_INV_SCALES = _MP(HOLDING_INV_SCALES)
+INPUT_REGISTER_OFFSETS = _MP(INPUT_REGISTER_OFFSETS)
+HOLDING_REGISTER_OFFSETS = _MP(HOLDING_REGISTER_OFFSETS)
+HOLDING_WRITE_BOUNDS = _MP(HOLDING_WRITE_BOUNDS)
+HOLDING_MIN_MAX_STEP = _MP(HOLDING_MIN_MAX_STEP)
+OPERATING_MODES_INV = _MP(OPERATING_MODES_INV)
+ERROR_CODES_INV = _MP(ERROR_CODES_INV)
+HOLDING_NAME_TO_ADDR = _MP(HOLDING_NAME_TO_ADDR)
+COIL_NAME_TO_ADDR = _MP(COIL_NAME_TO_ADDR)
+POLL_TIERS = _MP(POLL_TIERS)
+
+# Dense tuple index over the (frozen) holdings: addresses are small ints,
+# so HOLDING_BY_ID[addr] is a C-level sequence index with no hashing,
+# with None filling the gaps
+HOLDING_BY_ID = tuple(
+    HOLDING_REGISTER_MAP.get(addr) for addr in range(max(HOLDING_REGISTER_MAP) + 1)
+)
+
+
+def spec_for(addr):
+    """Return the holding spec for addr, or None if undefined."""
+    if 0 <= addr < len(HOLDING_BY_ID):
+        return HOLDING_BY_ID[addr]
+    return None
@@ -2,10 +2,11 @@ from __future__ import annotations
 # custom_components/grant_aerona3/coordinator.py
 import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any, Dict
 
-from pymodbus.client import ModbusTcpClient, ModbusSerialClient
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,13 +19,69 @@ from .const import (
     CONF_UNIT_ID,
     CONF_SCAN_INTERVAL,
     INPUT_REGISTER_MAP,
-    HOLDING_REGISTER_MAP,
-    COIL_REGISTER_MAP,
+    INPUT_SCALES,
     DEFAULT_SCAN_INTERVAL,
+    INPUT_REGISTER_BLOCKS,
+    WRITABLE_HOLDINGS,
+    WRITABLE_HOLDING_BLOCKS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class _SharedModbusClient:
+    """One Modbus connection shared by every entry targeting one endpoint.
+
+    Gateways frequently cap concurrent TCP connections at 2-4, so config
+    entries that differ only by unit ID must multiplex a single socket
+    rather than hold one each. Holders live in
+    hass.data[DOMAIN]["shared_clients"] keyed by endpoint and are
+    reference counted: the last coordinator to shut down closes the
+    connection.
+    """
+
+    def __init__(self, make_client) -> None:
+        self._make_client = make_client
+        self._client = None
+        self._lock = asyncio.Lock()
+        self.refs = 0
+
+    def adopt(self, client) -> None:
+        """Take over an already-connected client (from config flow probing).
+
+        If the endpoint is already being served by a live connection, the
+        probe socket is released instead of displacing it.
+        """
+        if self._client is not None and getattr(self._client, "connected", False):
+            client.close()
+            return
+        self.drop()
+        self._client = client
+
+    async def ensure_connected(self):
+        """Return the shared client, (re)connecting it if needed.
+
+        The lock keeps two coordinators on the same endpoint from racing
+        to build or connect the client.
+        """
+        async with self._lock:
+            if self._client is None:
+                self._client = self._make_client()
+            if not self._client.connected:
+                if not await self._client.connect():
+                    raise ConnectionError("Failed to connect")
+            return self._client
+
+    def drop(self) -> None:
+        """Close the shared client so the next call reconnects cleanly."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+
 class GrantAerona3Coordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinator for Grant Aerona3 Heat Pump."""
 
@@ -59,8 +116,99 @@ class GrantAerona3Coordinator(DataUpdateCoordinator[Dict[str, Any]]):
             name=f"{DOMAIN}_{self.host}",
             update_interval=timedelta(seconds=scan_interval),
         )
-        # NOTE: A fresh client is created per fetch/write to avoid connection state issues.
-        # self._client removed — it was created here but never used anywhere.
+        # One client per endpoint is kept open across polls; reconnecting
+        # costs a TCP handshake per cycle on top of every scan_interval
+        # otherwise. Entries for different unit IDs behind the same
+        # gateway share the holder instead of holding a socket each.
+        shared = hass.data.setdefault(DOMAIN, {}).setdefault("shared_clients", {})
+        self._shared_key = self._endpoint_key()
+        holder = shared.get(self._shared_key)
+        if holder is None:
+            holder = shared[self._shared_key] = _SharedModbusClient(self._make_client)
+        holder.refs += 1
+        self._shared = holder
+
+        # Published as plain attributes so entities can reach the register
+        # dicts in one attribute read instead of indexing coordinator.data
+        self.input_registers: Dict[int, float] = {}
+        self.holding_registers: Dict[int, float] = {}
+
+        # Contiguous read plans built from the const block tables: one
+        # Modbus transaction per run instead of one per register. Each run
+        # is (start, count, pairs) where pairs holds (address, offset into
+        # the response) for every mapped register the run decodes, so the
+        # poll loop does no arithmetic or membership tests of its own.
+        self._input_runs = tuple(
+            (start, count, tuple(
+                (reg, reg - start) for reg in range(start, start + count)
+                if reg in INPUT_REGISTER_MAP
+            ))
+            for start, count in INPUT_REGISTER_BLOCKS
+        )
+        self._holding_runs = tuple(
+            (start, count, tuple(
+                (reg, reg - start) for reg in range(start, start + count)
+                if reg in WRITABLE_HOLDINGS
+            ))
+            for start, count in WRITABLE_HOLDING_BLOCKS
+        )
+        self._writable_count = len(WRITABLE_HOLDINGS)
+        # Only a few coils matter per poll; they all sit in one short span
+        critical_coils = (2, 6, 7, 18)  # Weather compensation and key settings
+        self._coil_runs = (
+            (
+                critical_coils[0],
+                critical_coils[-1] - critical_coils[0] + 1,
+                tuple((reg, reg - critical_coils[0]) for reg in critical_coils),
+            ),
+        )
+
+    def _endpoint_key(self):
+        """Registry key identifying the physical Modbus endpoint."""
+        if self.connection_type == "tcp":
+            return ("tcp", self.host, self.port)
+        return ("serial", self.serial_port)
+
+    def _make_client(self):
+        """Build an async Modbus client for the configured transport."""
+        if self.connection_type == "tcp":
+            return AsyncModbusTcpClient(host=self.host, port=self.port, timeout=5)
+        return AsyncModbusSerialClient(
+            method=self.method,
+            port=self.serial_port,
+            baudrate=self.baudrate,
+            bytesize=self.bytesize,
+            parity=self.parity,
+            stopbits=self.stopbits,
+            timeout=5,
+        )
+
+    def adopt_client(self, client) -> None:
+        """Hand an already-connected client (from config flow probing) over."""
+        self._shared.adopt(client)
+
+    async def _ensure_connected(self):
+        """Return the shared client, (re)connecting it if needed."""
+        try:
+            return await self._shared.ensure_connected()
+        except ConnectionError as err:
+            raise UpdateFailed(
+                f"Failed to connect to ASHP at {self.host}:{self.port}"
+            ) from err
+
+    def _drop_connection(self) -> None:
+        """Close the shared client so the next call reconnects cleanly."""
+        self._shared.drop()
+
+    async def async_shutdown(self) -> None:
+        """Release the shared connection when the entry unloads."""
+        await super().async_shutdown()
+        self._shared.refs -= 1
+        if self._shared.refs <= 0:
+            self.hass.data.get(DOMAIN, {}).get("shared_clients", {}).pop(
+                self._shared_key, None
+            )
+            self._shared.drop()
 
     async def _async_update_data(self) -> Dict[str, Any]:
         try:
@@ -71,169 +219,160 @@ class GrantAerona3Coordinator(DataUpdateCoordinator[Dict[str, Any]]):
             raise UpdateFailed(f"Error communicating with ASHP: {err}") from err
 
     async def _fetch_data(self) -> Dict[str, Any]:
+        # All keys are always present (empty dicts on partial failure), so
+        # entity properties can index coordinator.data directly instead of
+        # chaining .get(..., {}) with a fresh default dict per call
         data = {
             "input_registers": {},
             "holding_registers": {},
             "coil_registers": {},
-            "last_update": asyncio.get_running_loop().time(),
+            "scaled_inputs": {},
+            "last_update": time.monotonic(),
         }
         
-        # Create a fresh client for each fetch to avoid connection issues
-        if self.connection_type == "tcp":
-            client = ModbusTcpClient(host=self.host, port=self.port, timeout=5)
-        else:
-            client = ModbusSerialClient(
-                method=self.method,
-                port=self.serial_port,
-                baudrate=self.baudrate,
-                bytesize=self.bytesize,
-                parity=self.parity,
-                stopbits=self.stopbits,
-                timeout=5,
-            )
-        
         try:
-            # Connect with timeout
-            connected = await asyncio.wait_for(
-                self.hass.async_add_executor_job(client.connect), 
-                timeout=30.0
+            client = await self._ensure_connected()
+
+            # The three function-code groups are independent, so fire them
+            # together and let the async transaction layer pipeline them on
+            # the shared connection instead of serializing three round-trip
+            # sequences back to back
+            results = await asyncio.gather(
+                self._read_input_registers(client),
+                self._read_holding_registers(client),
+                self._read_coil_registers(client),
+                return_exceptions=True,
             )
-            if not connected:
-                raise UpdateFailed(f"Failed to connect to ASHP at {self.host}:{self.port}")
-            
-            # Read data with individual timeouts
-            data["input_registers"] = await self._read_input_registers(client)
-            data["holding_registers"] = await self._read_holding_registers(client)
-            data["coil_registers"] = await self._read_coil_registers(client)
+            errors = [res for res in results if isinstance(res, Exception)]
+            if len(errors) == len(results):
+                # Every group failed - treat it as a dead connection
+                raise errors[0]
+            for err in errors:
+                _LOGGER.warning("Partial Modbus read failure: %s", err)
+            data["input_registers"], data["holding_registers"], data["coil_registers"] = (
+                {} if isinstance(res, Exception) else res for res in results
+            )
+            # Scale inputs once per refresh so entity properties don't re-walk
+            # INPUT_REGISTER_MAP on every state read. The run plans only
+            # decode mapped addresses and INPUT_SCALES covers every mapped
+            # input, so no membership test is needed here.
+            data["scaled_inputs"] = {
+                reg_id: value * INPUT_SCALES[reg_id]
+                for reg_id, value in data["input_registers"].items()
+            }
             data["calculated"] = self._calculate_derived_values(
                 data["input_registers"], data["holding_registers"]
             )
+            self.input_registers = data["input_registers"]
+            self.holding_registers = data["holding_registers"]
             
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout during Modbus operation: %s", err)
+            self._drop_connection()
             raise UpdateFailed(f"Timeout during Modbus operation: {err}") from err
         except ModbusException as err:
             _LOGGER.error("Modbus error: %s", err)
+            self._drop_connection()
             raise UpdateFailed(f"Modbus communication error: {err}") from err
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.error("Unexpected error: %s", err)
+            self._drop_connection()
             raise UpdateFailed(f"Unexpected error: {err}") from err
-        finally:
-            try:
-                await self.hass.async_add_executor_job(client.close)
-            except Exception:
-                pass
         return data
 
     async def _read_input_registers(self, client: object) -> Dict[int, float]:
         input_data = {}
-        
-        # Read only the most critical registers first to test connectivity
-        critical_registers = [0, 1, 3, 6, 9]  # Return temp, frequency, power, outdoor temp, flow temp
-        
-        for reg_id in critical_registers:
-            if reg_id in INPUT_REGISTER_MAP:
-                try:
-                    result = await asyncio.wait_for(
-                        self.hass.async_add_executor_job(
-                            lambda reg=reg_id: client.read_input_registers(reg, count=1, device_id=self.unit_id)
-                        ),
-                        timeout=3.0
-                    )
-                    if not result.isError():
-                        raw_value = result.registers[0]
-                        # Handle signed 16-bit values
-                        if raw_value > 32767:
-                            raw_value = raw_value - 65536
-                        input_data[reg_id] = raw_value
-                    else:
-                        _LOGGER.debug("Error reading input register %d: %s", reg_id, result)
-                except Exception as err:
-                    _LOGGER.debug("Failed to read input register %d: %s", reg_id, err)
-        
-        # If critical registers work, try reading the rest
-        if input_data:
-            remaining_registers = [reg for reg in INPUT_REGISTER_MAP.keys() if reg not in critical_registers]
-            for reg_id in remaining_registers:
-                try:
-                    result = await asyncio.wait_for(
-                        self.hass.async_add_executor_job(
-                            lambda reg=reg_id: client.read_input_registers(reg, count=1, device_id=self.unit_id)
-                        ),
-                        timeout=2.0
-                    )
-                    if not result.isError():
-                        raw_value = result.registers[0]
-                        if raw_value > 32767:
-                            raw_value = raw_value - 65536
-                        input_data[reg_id] = raw_value
-                except Exception as err:
-                    _LOGGER.debug("Failed to read input register %d: %s", reg_id, err)
-                    continue  # Continue with other registers
-        
+
+        # One transaction per contiguous run instead of one per register
+        for start, count, reg_pairs in self._input_runs:
+            try:
+                result = await client.read_input_registers(
+                    start, count=count, device_id=self.unit_id
+                )
+            except Exception as err:
+                _LOGGER.debug(
+                    "Failed to read input registers %d-%d: %s",
+                    start, start + count - 1, err,
+                )
+                continue  # Continue with other runs
+            if result.isError():
+                _LOGGER.debug(
+                    "Error reading input registers %d-%d: %s",
+                    start, start + count - 1, result,
+                )
+                continue
+            registers = result.registers
+            for reg_id, offset in reg_pairs:
+                raw_value = registers[offset]
+                # Branchless signed 16-bit reinterpretation (same idiom as
+                # the standalone scanner): subtracts 0x10000 iff bit 15 is set
+                input_data[reg_id] = raw_value - ((raw_value & 0x8000) << 1)
+
         return input_data
 
     async def _read_holding_registers(self, client: object) -> Dict[int, float]:
         holding_data = {}
-        
-        # Get all writable registers from the map - these are the ones we need for number entities
-        writable_registers = [reg_id for reg_id, config in HOLDING_REGISTER_MAP.items() if config.get("writable", False)]
-        
-        _LOGGER.debug("Reading %d writable holding registers: %s", len(writable_registers), writable_registers)
-        
-        # Read registers in smaller batches to avoid overwhelming the device
-        batch_size = 5
-        for i in range(0, len(writable_registers), batch_size):
-            batch = writable_registers[i:i + batch_size]
-            
-            for reg_id in batch:
-                try:
-                    result = await asyncio.wait_for(
-                        self.hass.async_add_executor_job(
-                            lambda reg=reg_id: client.read_holding_registers(reg, count=1, device_id=self.unit_id)
-                        ),
-                        timeout=2.0
-                    )
-                    if not result.isError():
-                        raw_value = result.registers[0]
-                        if raw_value > 32767:
-                            raw_value = raw_value - 65536
-                        holding_data[reg_id] = raw_value
-                        _LOGGER.debug("Successfully read register %d: %d", reg_id, raw_value)
-                    else:
-                        _LOGGER.debug("Error reading holding register %d: %s", reg_id, result)
-                except Exception as err:
-                    _LOGGER.debug("Failed to read holding register %d: %s", reg_id, err)
-            
-            # Small delay between batches to avoid overwhelming the device
-            if i + batch_size < len(writable_registers):
+
+        # The writable registers are the ones we need for number entities;
+        # the run plan over that subset is precomputed in __init__
+        for run_idx, (start, count, reg_pairs) in enumerate(self._holding_runs):
+            # Small delay between runs to avoid overwhelming the device
+            if run_idx:
                 await asyncio.sleep(0.1)
-        
-        _LOGGER.info("Successfully read %d/%d holding registers", len(holding_data), len(writable_registers))
+            try:
+                result = await client.read_holding_registers(
+                    start, count=count, device_id=self.unit_id
+                )
+            except Exception as err:
+                _LOGGER.debug(
+                    "Failed to read holding registers %d-%d: %s",
+                    start, start + count - 1, err,
+                )
+                continue
+            if result.isError():
+                _LOGGER.debug(
+                    "Error reading holding registers %d-%d: %s",
+                    start, start + count - 1, result,
+                )
+                continue
+            registers = result.registers
+            for reg_id, offset in reg_pairs:
+                raw_value = registers[offset]
+                holding_data[reg_id] = raw_value - ((raw_value & 0x8000) << 1)
+
+        _LOGGER.info(
+            "Successfully read %d/%d holding registers",
+            len(holding_data), self._writable_count,
+        )
         return holding_data
 
     async def _read_coil_registers(self, client: object) -> Dict[int, bool]:
         coil_data = {}
-        
-        # Read only a few critical coils to avoid timeouts
-        critical_coils = [2, 6, 7, 18]  # Weather compensation and key settings
-        
-        for reg_id in critical_coils:
-            if reg_id in COIL_REGISTER_MAP:
-                try:
-                    result = await asyncio.wait_for(
-                        self.hass.async_add_executor_job(
-                            lambda reg=reg_id: client.read_coils(reg, count=1, device_id=self.unit_id)
-                        ),
-                        timeout=2.0
-                    )
-                    if not result.isError():
-                        coil_data[reg_id] = result.bits[0]
-                    else:
-                        _LOGGER.debug("Error reading coil register %d: %s", reg_id, result)
-                except Exception as err:
-                    _LOGGER.debug("Failed to read coil register %d: %s", reg_id, err)
-        
+
+        # The critical coils all sit in one span, so this is a single read
+        for start, count, coil_pairs in self._coil_runs:
+            try:
+                result = await client.read_coils(
+                    start, count=count, device_id=self.unit_id
+                )
+            except Exception as err:
+                _LOGGER.debug(
+                    "Failed to read coils %d-%d: %s",
+                    start, start + count - 1, err,
+                )
+                continue
+            if result.isError():
+                _LOGGER.debug(
+                    "Error reading coils %d-%d: %s",
+                    start, start + count - 1, result,
+                )
+                continue
+            bits = result.bits
+            for reg_id, offset in coil_pairs:
+                coil_data[reg_id] = bits[offset]
+
         return coil_data
 
     def _calculate_derived_values(self, input_data: Dict[int, float], holding_data: Dict[int, float]) -> Dict[str, Any]:
@@ -271,97 +410,42 @@ class GrantAerona3Coordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
     async def async_write_register(self, register: int, value: int) -> bool:
         """Write to a holding register."""
-        if self.connection_type == "tcp":
-            client = ModbusTcpClient(host=self.host, port=self.port, timeout=5)
-        else:
-            client = ModbusSerialClient(
-                method=self.method,
-                port=self.serial_port,
-                baudrate=self.baudrate,
-                bytesize=self.bytesize,
-                parity=self.parity,
-                stopbits=self.stopbits,
-                timeout=5,
-            )
-        
         try:
-            connected = await asyncio.wait_for(
-                self.hass.async_add_executor_job(client.connect),
-                timeout=10.0
-            )
-            if not connected:
-                _LOGGER.error("Failed to connect for writing register %d", register)
-                return False
-            
-            result = await asyncio.wait_for(
-                self.hass.async_add_executor_job(
-                    lambda: client.write_register(register, value, device_id=self.unit_id)
-                ),
-                timeout=5.0
+            client = await self._ensure_connected()
+
+            result = await client.write_register(
+                register, value, device_id=self.unit_id
             )
-            
+
             if result.isError():
                 _LOGGER.error("Error writing register %d: %s", register, result)
                 return False
-            
+
             _LOGGER.info("Successfully wrote value %d to register %d", value, register)
             await self.async_request_refresh()
             return True
-            
+
         except Exception as err:
             _LOGGER.error("Failed to write register %d: %s", register, err)
+            self._drop_connection()
             return False
-        finally:
-            try:
-                await self.hass.async_add_executor_job(client.close)
-            except Exception:
-                pass
 
     async def async_write_coil(self, address: int, value: bool) -> bool:
         """Write to a coil register."""
-        # Create a fresh client like async_write_register does
-        if self.connection_type == "tcp":
-            client = ModbusTcpClient(host=self.host, port=self.port, timeout=5)
-        else:
-            client = ModbusSerialClient(
-                method=self.method,
-                port=self.serial_port,
-                baudrate=self.baudrate,
-                bytesize=self.bytesize,
-                parity=self.parity,
-                stopbits=self.stopbits,
-                timeout=5,
-            )
-        
         try:
-            connected = await asyncio.wait_for(
-                self.hass.async_add_executor_job(client.connect),
-                timeout=10.0
-            )
-            if not connected:
-                _LOGGER.error("Failed to connect for writing coil %d", address)
-                return False
-            
-            result = await asyncio.wait_for(
-                self.hass.async_add_executor_job(
-                    lambda: client.write_coil(address, value, device_id=self.unit_id)
-                ),
-                timeout=5.0
-            )
-            
+            client = await self._ensure_connected()
+
+            result = await client.write_coil(address, value, device_id=self.unit_id)
+
             if result.isError():
                 _LOGGER.error("Error writing coil %d: %s", address, result)
                 return False
-            
+
             _LOGGER.info("Successfully wrote value %s to coil %d", value, address)
             await self.async_request_refresh()
             return True
-            
+
         except Exception as err:
             _LOGGER.error("Failed to write coil %d: %s", address, err)
+            self._drop_connection()
             return False
-        finally:
-            try:
-                await self.hass.async_add_executor_job(client.close)
-            except Exception:
-                pass
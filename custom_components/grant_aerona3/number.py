@@ -14,7 +14,15 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, MANUFACTURER, MODEL, HOLDING_REGISTER_MAP
+from .const import (
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    HOLDING_REGISTER_MAP,
+    HOLDING_MIN_MAX_STEP,
+    HOLDING_VALIDATORS,
+    WRITABLE_HOLDINGS,
+)
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,12 +50,11 @@ async def async_setup_entry(
     entities = []
     # Debug: Check what's in HOLDING_REGISTER_MAP
     _LOGGER.info("Total holding registers defined: %d", len(HOLDING_REGISTER_MAP))
-    writable_registers = [reg for reg, config in HOLDING_REGISTER_MAP.items() if config.get("writable", False)]
-    _LOGGER.info("Writable registers: %s", writable_registers)
+    _LOGGER.info("Writable registers: %s", sorted(WRITABLE_HOLDINGS))
 
     # Create number entities for ALL writable holding registers
     for register_id, config in HOLDING_REGISTER_MAP.items():
-        if config.get("writable", False):
+        if register_id in WRITABLE_HOLDINGS:
             _LOGGER.info("Creating number entity for register %d: %s", register_id, config["name"])
             try:
                 entity = GrantAerona3HoldingNumber(coordinator, config_entry, register_id)
@@ -109,10 +116,12 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_unit_of_measurement = self._register_config.get("unit")
         self._attr_mode = NumberMode.BOX  # Use box mode for precise control
 
-        # Use min/max/step from the register config, fallback to safe defaults
-        self._attr_native_min_value = self._register_config.get("min", 0)
-        self._attr_native_max_value = self._register_config.get("max", 100)
-        self._attr_native_step = self._register_config.get("step", 1)
+        # min/max/step with the safe defaults already folded in by const
+        (
+            self._attr_native_min_value,
+            self._attr_native_max_value,
+            self._attr_native_step,
+        ) = HOLDING_MIN_MAX_STEP[register_id]
 
         # Set icon based on function
         name_lower = self._register_config["name"].lower()
@@ -167,7 +176,20 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         _LOGGER.info("Setting value %s for register %d (%s)", value, self._register_id, self._attr_name)
-        
+
+        # The UI respects min/max, but service calls can bypass it; the
+        # precompiled validator has the bounds baked in
+        validator = HOLDING_VALIDATORS.get(self._register_id)
+        if validator is not None and not validator(value):
+            _LOGGER.error(
+                "Value %s out of range %s-%s for %s",
+                value,
+                self._attr_native_min_value,
+                self._attr_native_max_value,
+                self._attr_name,
+            )
+            return
+
         scale = self._register_config.get("scale", 1)
         raw_value = int(value / scale)
         
@@ -4,11 +4,36 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_SCAN_INTERVAL
 
+from .config_flow import SCAN_INTERVAL_VALIDATOR
+
+# Flow-rate bounds are only used here, but the validator is likewise built
+# once at import instead of per form render
+FLOW_RATE_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=1, max=100))
+
 DOMAIN = "grant_aerona3"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 CONF_FLOW_RATE_LPM = "flow_rate_lpm"
 DEFAULT_FLOW_RATE_LPM = 34  # L/min
 
+
+def _build_options_schema(scan_default, flow_rate_default):
+    """Compose the options schema around the two dynamic defaults.
+
+    The validator chains are module-level constants, so only the two
+    ``vol.Optional`` wrappers are created per form render.
+    """
+    return vol.Schema({
+        vol.Optional(
+            CONF_SCAN_INTERVAL,
+            default=scan_default
+        ): SCAN_INTERVAL_VALIDATOR,
+        vol.Optional(
+            CONF_FLOW_RATE_LPM,
+            default=flow_rate_default
+        ): FLOW_RATE_VALIDATOR,
+    })
+
+
 class GrantAerona3OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle Grant Aerona3 options flow."""
 
@@ -19,24 +44,19 @@ class GrantAerona3OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        # Resolve the options -> data -> default chains once per form build
+        options = self.config_entry.options
+        data = self.config_entry.data
+        scan_default = options.get(
+            CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        flow_rate_default = options.get(
+            CONF_FLOW_RATE_LPM, data.get(CONF_FLOW_RATE_LPM, DEFAULT_FLOW_RATE_LPM)
+        )
+
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=self.config_entry.options.get(
-                        CONF_SCAN_INTERVAL,
-                        self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-                    )
-                ): vol.All(int, vol.Range(min=5, max=3600)),
-                vol.Optional(
-                    CONF_FLOW_RATE_LPM,
-                    default=self.config_entry.options.get(
-                        CONF_FLOW_RATE_LPM,
-                        self.config_entry.data.get(CONF_FLOW_RATE_LPM, DEFAULT_FLOW_RATE_LPM)
-                    )
-                ): vol.All(float, vol.Range(min=1, max=100)),
-            }),
+            data_schema=_build_options_schema(scan_default, flow_rate_default),
             description_placeholders={
                 "scan_interval": "How often to poll the heat pump (seconds)",
                 "flow_rate_lpm": "Flow rate in litres per minute (L/min)",
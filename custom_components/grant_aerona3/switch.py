@@ -82,17 +82,15 @@ class GrantAerona3BaseSwitch(CoordinatorEntity, SwitchEntity):
         """Initialize the switch entity."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        # Built once per entity - HA reads device_info repeatedly during
+        # setup and registry updates, so don't rebuild the dict per access
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
             "name": "ASHP Grant Aerona3",
             "manufacturer": MANUFACTURER,
             "model": MODEL,
             "sw_version": "2.0.0",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
+            "configuration_url": f"http://{config_entry.data.get('host', '')}",
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None: